@@ -0,0 +1,7 @@
+def normalize_column_name(col):
+    """Normalize a single column name (lowercase, underscores, tsX_flt)"""
+    col = str(col).strip().lower().replace(' ', '_')
+    # Special handling for temperature sensor columns
+    if 'ts' in col and '_flt' in col:
+        col = 'ts' + col.split('ts')[-1]  # Normalize to tsX_flt format
+    return col
@@ -0,0 +1,30 @@
+import numpy as np
+
+def minmax_envelope(values, n_out):
+    """Row indices, per column, of the first/last row and each bucket's min and max.
+
+    For values of shape (n, k) returns an (m, k) index array with m <= n_out:
+    column j keeps the extremes of column j in every bucket, in row order, so
+    spikes and dropouts on any channel survive the thinning. NaN rows are only
+    kept for buckets that hold nothing else, which keeps gaps visible.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n, k = values.shape
+    n_buckets = (n_out - 2) // 2
+    if n <= n_out or n_buckets < 1:
+        return np.repeat(np.arange(n)[:, None], k, axis=1)
+    size = -(-(n - 2) // n_buckets)
+    # Rounding the size up can leave buckets over; drop them so none is all padding
+    n_buckets = -(-(n - 2) // size)
+    pad = ((0, n_buckets * size - (n - 2)), (0, 0))
+    inner = values[1:-1]
+    nan = np.isnan(inner)
+    lows = np.pad(np.where(nan, np.inf, inner), pad, constant_values=np.inf)
+    highs = np.pad(np.where(nan, -np.inf, inner), pad, constant_values=-np.inf)
+    starts = 1 + size * np.arange(n_buckets)[:, None]
+    mins = starts + lows.reshape(n_buckets, size, k).argmin(axis=1)
+    maxs = starts + highs.reshape(n_buckets, size, k).argmax(axis=1)
+    # Within a bucket, whichever extreme comes first is drawn first
+    pairs = np.sort(np.stack([mins, maxs], axis=1), axis=1).reshape(2 * n_buckets, k)
+    return np.vstack([np.zeros((1, k), dtype=np.int64), pairs,
+                      np.full((1, k), n - 1, dtype=np.int64)])
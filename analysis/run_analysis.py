@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from analysis.columns import normalize_column_name
 
 # Configure logging
 logging.basicConfig(
@@ -12,48 +14,68 @@ logging.basicConfig(
     ]
 )
 
+# Fixed channel layout of the battery pack logs
+CELL_COLUMNS = [f'cell{i}' for i in range(1, 15)]
+TEMP_COLUMNS = [f'ts{i}' for i in range(1, 13)] + ['ts0_flt', 'ts13_flt']
+_TEMP_COLUMNS_LOWER = frozenset(TEMP_COLUMNS)
+
+# Columns each detector checks for, and everything a log needs for analysis
+REQUIRED_COLUMNS = {
+    'temp': frozenset(TEMP_COLUMNS),
+    'solder': frozenset(['dsg_current', 'chg_current'] + CELL_COLUMNS),
+    'weld': frozenset(['dsg_current', 'chg_current'] + CELL_COLUMNS + ['max_soc'])
+}
+ANALYSIS_COLUMNS = frozenset().union(*REQUIRED_COLUMNS.values())
+
+# Narrower dtypes for channels only the graphs read. Detector inputs stay float64:
+# cell spreads and variances are compared against thresholds, and float32 rounding
+# moves values sitting on a threshold to the other side of it. Every channel loaded
+# today feeds a detector, so none are narrowed.
+TELEMETRY_DTYPES = {}
+
 def moving_average(data, window_size):
     """Calculate the moving average of a time series."""
     return data.rolling(window=window_size).mean()
 
+def consecutive_runs(index_values, threshold):
+    """Find (start, stop) positions of runs whose index gaps stay within threshold."""
+    index_values = np.asarray(index_values)
+    if index_values.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(index_values) > threshold) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [index_values.size]))
+    return [(start, stop) for start, stop in zip(starts.tolist(), stops.tolist())
+            if stop - start > 1]
+
 def consecutive_sequence(index_list, threshold):
     """Find consecutive sequences in a list of indices."""
-    sequences = []
-    if not index_list:
-        return sequences
-    current_sequence = [index_list[0]]
-    for i in range(1, len(index_list)):
-        if index_list[i] - index_list[i-1] <= threshold:
-            current_sequence.append(index_list[i])
-        else:
-            if len(current_sequence) > 1:
-                sequences.append(current_sequence)
-            current_sequence = [index_list[i]]
-    if len(current_sequence) > 1:
-        sequences.append(current_sequence)
-    return sequences
+    return [list(index_list[start:stop])
+            for start, stop in consecutive_runs(index_list, threshold)]
 
 def normalize_column_names(df):
     """Robust column name normalization handling multiple formats"""
-    new_columns = []
-    for col in df.columns:
-        col = str(col).strip().lower().replace(' ', '_')
-        # Special handling for temperature sensor columns
-        if 'ts' in col and '_flt' in col:
-            col = 'ts' + col.split('ts')[-1]  # Normalize to tsX_flt format
-        new_columns.append(col)
-    df.columns = new_columns
+    df.columns = [normalize_column_name(col) for col in df.columns]
+    return df
+
+def downcast_telemetry(df):
+    """Store display-only channels as float32 and SoC as the smallest lossless integer"""
+    for col, dtype in TELEMETRY_DTYPES.items():
+        if col in df.columns and df[col].dtype.kind == 'f' and df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+    if 'max_soc' in df.columns:
+        df['max_soc'] = pd.to_numeric(df['max_soc'], downcast='integer')
     return df
 
 def validate_columns(df, required_columns):
     """Enhanced column validation with detailed output"""
-    missing = [col for col in required_columns if col not in df.columns]
+    missing = set(required_columns).difference(df.columns)
     
     if missing:
         print(f"\n[VALIDATION] Missing required columns:")
-        print(f"Expected: {required_columns}")
+        print(f"Expected: {sorted(required_columns)}")
         print(f"Actual: {df.columns.tolist()}")
-        print(f"Missing: {missing}\n")
+        print(f"Missing: {sorted(missing)}\n")
         return False
         
     print(f"[VALIDATION] All required columns present")
@@ -64,13 +86,9 @@ def temp_fluctuation_detection(parquet_data):
     try:
         Signal = 0
         critical_points = []
-        # Required columns
-        temp_arrays = ['ts1', 'ts2', 'ts3', 'ts4', 'ts5', 'ts6',
-                      'ts7', 'ts8', 'ts9', 'ts10', 'ts11', 'ts12',
-                      'ts0_flt', 'ts13_flt']
         # Find available columns (case-insensitive)
         available_sensors = [col for col in parquet_data.columns 
-                           if col.lower() in [t.lower() for t in temp_arrays]]
+                           if col.lower() in _TEMP_COLUMNS_LOWER]
         if not available_sensors:
             logging.warning("No temperature sensors found in data")
             return {"detected": False, "max_fluctuation": 0, "critical_points": []}
@@ -79,18 +97,18 @@ def temp_fluctuation_detection(parquet_data):
         ThresholdValv2 = 0.0025
         WindowThreshold = 20
         # Mean centering and variance calculation
-        ts_centered = parquet_data[available_sensors] - parquet_data[available_sensors].mean()
+        ts = parquet_data[available_sensors]
+        ts_centered = ts - ts.mean()
         rolling_mean = ts_centered.rolling(window=WindowThreshold).mean()
         diff = ts_centered - rolling_mean
-        variances = {}
-        for i, sensor in enumerate(available_sensors):
-            threshold = ThresholdValv1 if i < 12 else ThresholdValv2
-            var = diff[sensor][WindowThreshold-1:].var()
-            variances[sensor] = var
-            if var > threshold:
-                Signal = 1
-                critical_points.append(sensor)
-        max_var = max(variances.values()) if variances else 0
+        # All sensor variances at once; the first 12 sensors use the tighter threshold
+        variances = diff.iloc[WindowThreshold-1:].var()
+        thresholds = np.where(np.arange(len(available_sensors)) < 12, ThresholdValv1, ThresholdValv2)
+        critical_points = [sensor for sensor, above in
+                           zip(available_sensors, (variances.to_numpy() > thresholds).tolist())
+                           if above]
+        Signal = int(bool(critical_points))
+        max_var = variances.max()
         return {
             "detected": bool(Signal),
             "max_fluctuation": max_var,
@@ -105,9 +123,7 @@ def solder_issue_detection(parquet_data):
     try:
         Signal = 0
         CellWithIssue = None
-        # Required columns
-        required_cols = ['dsg_current', 'chg_current'] + [f'cell{i}' for i in range(1, 15)]
-        if not validate_columns(parquet_data, required_cols):
+        if not validate_columns(parquet_data, REQUIRED_COLUMNS['solder']):
             return {"detected": False, "severity": "None", "locations": []}
         # Parameters
         Threshold = 15
@@ -122,19 +138,18 @@ def solder_issue_detection(parquet_data):
         ]
         if len(rest_data) < NeglectFirstRows + NeglectLastRows:
             return {"detected": False, "severity": "None", "locations": []}
+        # Cell spread for every rest row at once; runs below only slice these arrays
+        cells_all = rest_data[CELL_COLUMNS].to_numpy()
+        CellDV_all = np.fmax.reduce(cells_all, axis=1) - np.fmin.reduce(cells_all, axis=1)
         # Analyze sequences
-        sequences = consecutive_sequence(rest_data.index.tolist(), Threshold)
-        result_dfs = [rest_data.loc[seq] for seq in sequences if len(seq) > 1]
-        for df in result_dfs:
-            if len(df) < NeglectFirstRows + NeglectLastRows:
+        runs = consecutive_runs(rest_data.index.to_numpy(), Threshold)
+        for start, stop in runs:
+            if stop - start < NeglectFirstRows + NeglectLastRows:
                 continue
-            df = df.iloc[NeglectFirstRows:-NeglectLastRows]
-            cell_cols = [f'cell{i}' for i in range(1, 15)]
-            MAX = df[cell_cols].max(axis=1)
-            MIN = df[cell_cols].min(axis=1)
-            CellDV = MAX - MIN
-            if CellDV.max() >= CellDVThreshold:
-                CentralTendency = [df[f'cell{i}'].mean() for i in range(1, 15)]
+            rows = slice(start + NeglectFirstRows, stop - NeglectLastRows)
+            CellDV = CellDV_all[rows]
+            if CellDV.size and np.fmax.reduce(CellDV) >= CellDVThreshold:
+                CentralTendency = np.nanmean(cells_all[rows], axis=0).tolist()
                 max_idx = np.argmax(CentralTendency)
                 min_idx = np.argmin(CentralTendency)
                 if abs(max_idx - min_idx) == 1:
@@ -164,9 +179,7 @@ def weld_issue_detection(parquet_data):
     try:
         Signal = 0
         CellWithIssue = None
-        # Required columns
-        required_cols = ['dsg_current', 'chg_current'] + [f'cell{i}' for i in range(1, 15)] + ['max_soc']
-        if not validate_columns(parquet_data, required_cols):
+        if not validate_columns(parquet_data, REQUIRED_COLUMNS['weld']):
             return {"detected": False, "confidence": 0.05, "cell_with_issue": None}
         # Parameters
         Threshold = 50
@@ -181,23 +194,24 @@ def weld_issue_detection(parquet_data):
             (parquet_data['dsg_current'] <= 1) & 
             (parquet_data['chg_current'] <= 1)
         ]
-        if len(rest_data) < NeglectFirstRows + NeglectLastRows:
+        # Only low-SoC logs are checked (never a NaN SoC), so no rest run can flag anything otherwise
+        if not soc <= SoCCheck or len(rest_data) < NeglectFirstRows + NeglectLastRows:
             return {"detected": False, "confidence": 0.05, "cell_with_issue": None}
+        # Cell spread for every rest row at once; runs below only slice these arrays
+        cells_all = rest_data[CELL_COLUMNS].to_numpy()
+        CellDV_all = np.fmax.reduce(cells_all, axis=1) - np.fmin.reduce(cells_all, axis=1)
         # Analyze sequences
-        sequences = consecutive_sequence(rest_data.index.tolist(), Threshold)
-        result_dfs = [rest_data.loc[seq] for seq in sequences if len(seq) > 1]
-        for df in result_dfs:
-            if len(df) < NeglectFirstRows + NeglectLastRows:
+        runs = consecutive_runs(rest_data.index.to_numpy(), Threshold)
+        for start, stop in runs:
+            if stop - start < NeglectFirstRows + NeglectLastRows:
                 continue
-            filtered = df.iloc[NeglectFirstRows:-NeglectLastRows]
-            if soc <= SoCCheck:
-                cells = filtered[[f'cell{i}' for i in range(1, 15)]]
-                CellDV = cells.max(axis=1) - cells.min(axis=1)
-                if CellDV.min() >= valv:
-                    Signal = 1
-                    min_idx = CellDV.idxmin()
-                    CellWithIssue = cells.loc[min_idx].idxmin()
-                    break
+            rows = slice(start + NeglectFirstRows, stop - NeglectLastRows)
+            CellDV = CellDV_all[rows]
+            if CellDV.size and np.fmin.reduce(CellDV) >= valv:
+                Signal = 1
+                min_row = cells_all[rows][np.nanargmin(CellDV)]
+                CellWithIssue = CELL_COLUMNS[np.nanargmin(min_row)]
+                break
         return {
             "detected": bool(Signal),
             "confidence": 0.95 if Signal else 0.05,
@@ -206,4 +220,32 @@ def weld_issue_detection(parquet_data):
         
     except Exception as e:
         logging.error(f"Weld issue detection failed: {str(e)}", exc_info=True)
-        return {"detected": False, "confidence": 0.05, "cell_with_issue": None}
\ No newline at end of file
+        return {"detected": False, "confidence": 0.05, "cell_with_issue": None}
+
+DETECTORS = {
+    'temp': temp_fluctuation_detection,
+    'solder': solder_issue_detection,
+    'weld': weld_issue_detection
+}
+
+def detector_frame(df, name):
+    """The columns one detector reads, as its own DataFrame (in the log's column order)"""
+    required = REQUIRED_COLUMNS[name]
+    return df[[col for col in df.columns if str(col).lower() in required]]
+
+def run_detectors(df, on_result=None):
+    """Run every detector in parallel and return {name: result}
+
+    Each worker gets its own column subset, so no pandas object is shared
+    between threads. on_result(name, result) is called as each one finishes.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(DETECTORS)) as executor:
+        futures = {executor.submit(func, detector_frame(df, name)): name
+                   for name, func in DETECTORS.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            results[name] = future.result()
+            if on_result is not None:
+                on_result(name, results[name])
+    return results
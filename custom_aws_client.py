@@ -1,23 +1,45 @@
 import os
-import boto3
 import logging
-import zstandard as zstd
-import pandas as pd
 import io
-import pyarrow.parquet as pq
-from botocore.config import Config
+import threading
 from ssl_config import ssl_configured
-import numpy as np
+from analysis.columns import normalize_column_name
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Parallel S3 requests saturate at around 16 per client
+LIST_WORKERS = 16
+DOWNLOAD_WORKERS = 16
+
+# Below this size a single GET beats splitting into ranges
+RANGE_THRESHOLD = 8 * 1024 * 1024
+
+# Read size when decompressing a log while it downloads
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 class AWSClient:
-    def __init__(self, access_key, secret_key, bucket_name="datalogs-processed-timeseries"):
+    def __init__(self, access_key, secret_key, bucket_name="datalogs-processed-timeseries",
+                 fallback_prefix=None):
         self.access_key = access_key
         self.secret_key = secret_key
         self.bucket_name = bucket_name
-        self.s3 = self._initialize_s3_client()
+        # Alternate top-level prefix (e.g. "vcu-backup/") tried when a key is missing
+        self.fallback_prefix = fallback_prefix
+        self._s3 = None
+        self._s3_lock = threading.Lock()
+
+    @property
+    def s3(self):
+        """S3 client, created (and boto3 imported) on first use"""
+        with self._s3_lock:
+            if self._s3 is None:
+                self._s3 = self._initialize_s3_client()
+            return self._s3
 
     def _initialize_s3_client(self):
         try:
+            import boto3
+            from botocore.config import Config
+
             if not ssl_configured:
                 logging.warning("SSL not properly configured, using less secure connection")
             
@@ -28,6 +50,7 @@ class AWSClient:
                 config=Config(
                     connect_timeout=30,
                     retries={'max_attempts': 3},
+                    max_pool_connections=max(LIST_WORKERS, DOWNLOAD_WORKERS),
                     s3={'addressing_style': 'path'}
                 ),
                 region_name='ap-south-1'  # Explicitly set your region
@@ -36,70 +59,218 @@ class AWSClient:
             logging.error(f"Failed to initialize S3 client: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to initialize S3 client: {str(e)}")
 
+    def _list_prefix(self, prefix, delimiter=None):
+        """Page through a prefix and return (contents, common_prefixes)"""
+        paginator = self.s3.get_paginator('list_objects_v2')
+        kwargs = {'Bucket': self.bucket_name, 'Prefix': prefix}
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        contents, prefixes = [], []
+        for page in paginator.paginate(**kwargs):
+            contents.extend(page.get('Contents', []))
+            prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+        return contents, prefixes
+
     def get_available_logs(self, imei):
         """Retrieve all .parquet.zst log files for the given IMEI"""
+        return [key for key, _, _ in self.get_available_log_objects(imei)]
+
+    def get_available_log_objects(self, imei):
+        """Retrieve (key, last_modified, size) for every .parquet.zst log of the IMEI"""
         try:
             base_path = f"vcu/MD-{imei}"
             logging.debug(f"Base path for IMEI {imei}: {base_path}")
-            
-            response = self.s3.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=base_path
+
+            # Walk the first two levels with a delimiter, then fan the
+            # remaining sub-prefixes (dates/types) out across the pool
+            contents, prefixes = self._list_prefix(base_path, '/')
+            with ThreadPoolExecutor(max_workers=LIST_WORKERS) as executor:
+                sub_prefixes = []
+                for found, children in executor.map(
+                        lambda prefix: self._list_prefix(prefix, '/'), prefixes):
+                    contents.extend(found)
+                    sub_prefixes.extend(children)
+                for found, _ in executor.map(self._list_prefix, sub_prefixes):
+                    contents.extend(found)
+
+            # Newest first, since that is the log users almost always want
+            log_files = sorted(
+                ((content['Key'], content['LastModified'], content['Size'])
+                 for content in contents
+                 if content['Key'].endswith('.parquet.zst')),
+                key=lambda log: (log[1], log[0]),
+                reverse=True
             )
-            
-            log_files = []
-            for content in response.get('Contents', []):
-                if content['Key'].endswith('.parquet.zst'):
-                    log_files.append(content['Key'])
-            
+
             logging.debug(f"Found log files: {log_files}")
             return log_files
         except Exception as e:
             logging.error(f"Error retrieving logs for IMEI {imei}: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to retrieve logs: {str(e)}")
         
-    def download_log_file(self, log_path):
+    def _get_range(self, log_path, start, end):
+        """Fetch one inclusive byte range of an object"""
+        response = self.s3.get_object(
+            Bucket=self.bucket_name,
+            Key=log_path,
+            Range=f"bytes={start}-{end}"
+        )
+        return start, response['Body'].read()
+
+    def _download_ranges(self, log_path, size, progress_callback=None):
+        """Fetch a large object as byte ranges in parallel, reassembled in order"""
+        logging.debug(f"Downloading file in {DOWNLOAD_WORKERS} ranges: {log_path}")
+        part_size = -(-size // DOWNLOAD_WORKERS)
+        buffer = bytearray(size)
+        done = 0
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(self._get_range, log_path, start, min(start + part_size, size) - 1)
+                for start in range(0, size, part_size)
+            ]
+            for future in as_completed(futures):
+                start, chunk = future.result()
+                buffer[start:start + len(chunk)] = chunk
+                done += len(chunk)
+                if progress_callback:
+                    progress_callback(done, size)
+        return buffer
+
+    def _locate_log(self, log_path):
+        """Return (key, size) for a log, trying the fallback prefix if it is missing"""
+        from botocore.exceptions import ClientError
+        candidates = [log_path]
+        if self.fallback_prefix and log_path.startswith('vcu/'):
+            candidates.append(self.fallback_prefix + log_path[len('vcu/'):])
+        for key in candidates:
+            logging.debug(f"Checking if file exists: {key}")
+            try:
+                head = self.s3.head_object(Bucket=self.bucket_name, Key=key)
+                return key, head['ContentLength']
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchKey', 'NotFound'):
+                    raise
+        raise FileNotFoundError(f"Log file {log_path} not found in bucket {self.bucket_name}")
+
+    def download_log_file(self, log_path, progress_callback=None):
         """Download and return log file content with better validation"""
         try:
             # Log the bucket name and log path for debugging
             logging.debug(f"Attempting to download log file: {log_path} from bucket: {self.bucket_name}")
 
             # First verify the file exists
-            logging.debug(f"Checking if file exists: {log_path}")
-            self.s3.head_object(Bucket=self.bucket_name, Key=log_path)
-            
-            # Then download
-            logging.debug(f"Downloading file: {log_path}")
-            response = self.s3.get_object(
-                Bucket=self.bucket_name,
-                Key=log_path
-            )
-            return response['Body'].read()
-        except self.s3.exceptions.NoSuchKey:
-            logging.error(f"Log file {log_path} not found in bucket {self.bucket_name}")
+            log_path, size = self._locate_log(log_path)
+
+            # Small objects are cheaper as a single GET
+            if size < RANGE_THRESHOLD:
+                logging.debug(f"Downloading file: {log_path}")
+                response = self.s3.get_object(
+                    Bucket=self.bucket_name,
+                    Key=log_path
+                )
+                data = response['Body'].read()
+                if progress_callback:
+                    progress_callback(size, size)
+                return data
+
+            return self._download_ranges(log_path, size, progress_callback)
+        except FileNotFoundError as e:
+            logging.error(str(e))
             return None
         except Exception as e:
             logging.error(f"Error downloading {log_path}: {str(e)}", exc_info=True)
             return None
         
-    def extract_archive(self, archive_data):
-        """Handle both actual zstd-compressed files and mislabeled parquet files"""
+    def stream_log_file(self, log_path, columns=None, progress_callback=None, dtypes=None):
+        """Download a log file and decode it into a DataFrame
+
+        Small files are decompressed chunk by chunk while the body streams
+        in, so the compressed copy is never held in full. Large files are
+        fetched as parallel byte ranges first, as in download_log_file, and
+        the compressed buffer is released before the DataFrame is built.
+        """
+        import zstandard as zstd
+        try:
+            logging.debug(f"Streaming log file: {log_path} from bucket: {self.bucket_name}")
+            log_path, size = self._locate_log(log_path)
+            if not size:
+                raise ValueError("Empty file downloaded from AWS")
+
+            if size >= RANGE_THRESHOLD:
+                data = self._download_ranges(log_path, size, progress_callback)
+                if not data.startswith(b'PAR1'):
+                    # Rebinding drops the compressed copy before parquet decoding
+                    data = zstd.ZstdDecompressor().decompress(data)
+                return self._read_parquet(data, columns, dtypes)
+
+            body = self.s3.get_object(Bucket=self.bucket_name, Key=log_path)['Body']
+            data = bytearray()
+            decompressor = None
+            done = 0
+            for chunk in body.iter_chunks(STREAM_CHUNK_SIZE):
+                if decompressor is None:
+                    # Mislabeled raw parquet files are kept as-is
+                    decompressor = (False if chunk.startswith(b'PAR1')
+                                    else zstd.ZstdDecompressor().decompressobj())
+                data += decompressor.decompress(chunk) if decompressor else chunk
+                done += len(chunk)
+                if progress_callback:
+                    progress_callback(done, size)
+            return self._read_parquet(data, columns, dtypes)
+        except FileNotFoundError as e:
+            logging.error(str(e))
+            raise RuntimeError(str(e))
+        except Exception as e:
+            logging.error(f"Error streaming {log_path}: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Failed to process file: {str(e)}")
+
+    def _read_parquet(self, data, columns=None, dtypes=None):
+        """Decode parquet bytes without copying them, keeping only the given columns
+
+        dtypes maps normalized column names to narrower float types (e.g.
+        'float32'); matching float columns are cast in Arrow, so pandas
+        never holds a wide copy of them.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(pa.BufferReader(pa.py_buffer(data)))
+        if columns is not None:
+            wanted = set(columns)
+            columns = [name for name in parquet_file.schema_arrow.names
+                       if normalize_column_name(name) in wanted]
+        table = parquet_file.read(columns=columns, use_threads=True,
+                                  use_pandas_metadata=True)
+        if dtypes:
+            for i, field in enumerate(table.schema):
+                dtype = dtypes.get(normalize_column_name(field.name))
+                if dtype is None or not pa.types.is_floating(field.type):
+                    continue
+                target = pa.type_for_alias(dtype)
+                if target != field.type:
+                    table = table.set_column(i, field.with_type(target),
+                                             table.column(i).cast(target))
+        # Free each Arrow column as soon as pandas has copied it out
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def extract_archive(self, archive_data, columns=None):
+        """Handle both actual zstd-compressed files and mislabeled parquet files
+
+        If columns is given, only the parquet columns whose normalized name
+        is in it are decoded.
+        """
+        import zstandard as zstd
         try:
             # If archive_data is a StreamingBody (from S3), read it first
             if hasattr(archive_data, 'read'):
                 archive_data = archive_data.read()
 
             # Check if the data starts with Parquet magic bytes (b'PAR1')
-            if archive_data.startswith(b'PAR1'):
-                # It's actually a raw parquet file - read directly
-                parquet_file = io.BytesIO(archive_data)
-                return pq.read_table(parquet_file).to_pandas()
-            else:
+            if not archive_data.startswith(b'PAR1'):
                 # Try zstd decompression (for genuinely compressed files)
                 dctx = zstd.ZstdDecompressor()
-                decompressed_data = dctx.decompress(archive_data)
-                parquet_file = io.BytesIO(decompressed_data)
-                return pq.read_table(parquet_file).to_pandas()
+                archive_data = dctx.decompress(archive_data)
+            # Otherwise it's actually a raw parquet file - read directly
+            return self._read_parquet(archive_data, columns)
 
         except Exception as e:
             logging.error(f"Error processing file: {str(e)}", exc_info=True)
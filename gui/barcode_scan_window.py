@@ -1,13 +1,16 @@
 import sys
 import os
+import re
 import serial
 import time
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton,
     QHBoxLayout, QMessageBox, QProgressBar, QFileDialog, QListWidget,
     QFrame, QSplitter, QGridLayout, QSpacerItem, QSizePolicy, QTableWidget,
-    QTableWidgetItem, QHeaderView, QInputDialog, QLineEdit, QGraphicsDropShadowEffect,
-    QDialog, QTabWidget, QFormLayout, QStackedWidget, QScrollArea
+    QTableWidgetItem, QHeaderView, QInputDialog, QLineEdit,
+    QDialog, QTabWidget, QFormLayout, QStackedWidget, QScrollArea,
+    QGraphicsOpacityEffect
 )
 from PyQt5.QtGui import (
     QFont, QPixmap, QColor, QPalette, QIcon, QFontDatabase, 
@@ -15,23 +18,88 @@ from PyQt5.QtGui import (
 )
 from PyQt5.QtCore import (
     Qt, QThread, pyqtSignal, QSize, QPropertyAnimation, 
-    QEasingCurve, QRect, QTimer, QPoint
+    QEasingCurve, QRect, QTimer, QPoint, QSignalBlocker
 )
 
 # Global variable to store scanned barcode
 SCANNED_BARCODE = None
 
+# Shared fonts; setFont() copies them, so one instance serves every widget
+_FONT_9 = QFont("Montserrat", 9)
+_FONT_10 = QFont("Montserrat", 10)
+_FONT_10_BOLD = QFont("Montserrat", 10, QFont.Bold)
+_FONT_11 = QFont("Montserrat", 11)
+_FONT_12 = QFont("Montserrat", 12)
+_FONT_12_BOLD = QFont("Montserrat", 12, QFont.Bold)
+_FONT_14 = QFont("Montserrat", 14)
+_FONT_14_BOLD = QFont("Montserrat", 14, QFont.Bold)
+_FONT_18_BOLD = QFont("Montserrat", 18, QFont.Bold)
+_FONT_22_BOLD = QFont("Montserrat", 22, QFont.Bold)
+
+# "VIN:...;IMEI:...;UUID:..." fields in a scanned barcode
+_BARCODE_RE = re.compile(r'(?i)(vin|imei|uuid)\s*:\s*([^;]+)')
+
+def parse_barcode(barcode):
+    """Split a scanned barcode into its VIN/IMEI/UUID fields"""
+    parsed_data = {m.group(1).lower(): m.group(2).strip() for m in _BARCODE_RE.finditer(barcode)}
+    if not parsed_data:
+        print(f"Error parsing barcode: no VIN/IMEI/UUID fields in {barcode!r}")
+        # Keep the raw code so the scan isn't lost
+        return {'uuid': barcode}
+    return {key: parsed_data.get(key, '') for key in ('vin', 'imei', 'uuid')}
+
+@lru_cache(maxsize=None)
+def _asset_names():
+    """List the bundled asset files once instead of stat-ing each icon path"""
+    try:
+        return frozenset(os.listdir("assets"))
+    except OSError:
+        return frozenset()
+
+@lru_cache(maxsize=32)
+def _icon(path):
+    """Load an icon asset once and share it between scan windows"""
+    return QIcon(path)
+
+@lru_cache(maxsize=32)
+def _cached_scaled_pixmap(path, w, h):
+    """Load an image once and return it scaled to fit w x h"""
+    pixmap = QPixmap(path)
+    # Pre-scaled assets (and missing ones) are used as-is, skipping the smooth filter
+    if pixmap.isNull() or pixmap.size().scaled(w, h, Qt.KeepAspectRatio) == pixmap.size():
+        return pixmap
+    return pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+# Serial read timeout; reads poll at this interval so a stop is noticed quickly
+SCAN_READ_TIMEOUT = 0.5
+# How long one scan attempt waits for a barcode
+SCAN_ATTEMPT_TIMEOUT = 5
+
+def open_scanner(port, baudrate):
+    """Open the barcode scanner serial port"""
+    return serial.Serial(
+        port=port,
+        baudrate=baudrate,
+        parity=serial.PARITY_NONE,
+        stopbits=serial.STOPBITS_ONE,
+        bytesize=serial.EIGHTBITS,
+        timeout=SCAN_READ_TIMEOUT
+    )
+
 class BarcodeScanThread(QThread):
     """Thread to handle barcode scanning without freezing the UI"""
-    scan_complete = pyqtSignal(str)
+    scan_complete = pyqtSignal(str, dict)
     scan_error = pyqtSignal(str)
     scan_progress = pyqtSignal(int)
     scan_status = pyqtSignal(str)
+    scanner_lost = pyqtSignal(object)
 
-    def __init__(self, port="COM3", baudrate=115200):
+    def __init__(self, port="COM3", baudrate=115200, scanner=None):
         super().__init__()
         self.port = port
         self.baudrate = baudrate
+        # Already-open serial handle owned by the window (None = open per attempt)
+        self.scanner = scanner
         self.is_running = True
 
     def run(self):
@@ -53,24 +121,44 @@ class BarcodeScanThread(QThread):
                 if not self.is_running:
                     return
                 self.scan_status.emit(f"Attempt {retry + 1} of {max_retries}...")
-                scanner = serial.Serial(
-                    port=self.port,
-                    baudrate=self.baudrate,
-                    parity=serial.PARITY_NONE,
-                    stopbits=serial.STOPBITS_ONE,
-                    bytesize=serial.EIGHTBITS,
-                    timeout=5
-                )
-                line = scanner.readline().decode("utf-8").strip()
-                scanner.close()
+                if self.scanner is not None:
+                    # Port was pre-opened by the window, only issue the read
+                    try:
+                        line = self.read_line(self.scanner)
+                    except serial.SerialException:
+                        # Unplugged or failed handle, let the window drop it and reopen
+                        self.scanner_lost.emit(self.scanner)
+                        raise
+                else:
+                    scanner = open_scanner(self.port, self.baudrate)
+                    try:
+                        line = self.read_line(scanner)
+                    finally:
+                        scanner.close()
+                if not self.is_running:
+                    # Cancelled while the read was blocking, drop the result
+                    return
                 if line:
-                    self.scan_complete.emit(line)
+                    # Parse here so the UI thread only receives the fields
+                    self.scan_complete.emit(line, parse_barcode(line))
                     return
                 else:
                     self.scan_status.emit(f"Retry {retry + 1}: No barcode detected")
             self.scan_error.emit("No barcode detected. Please try again.")
         except Exception as e:
-            self.scan_error.emit(f"Scanner error: {str(e)}")
+            if self.is_running:
+                self.scan_error.emit(f"Scanner error: {str(e)}")
+
+    def read_line(self, scanner):
+        """Read one barcode line, giving up after SCAN_ATTEMPT_TIMEOUT or on stop()"""
+        data = b""
+        deadline = time.monotonic() + SCAN_ATTEMPT_TIMEOUT
+        # A line can straddle read timeouts, so keep what each read returned
+        while self.is_running and time.monotonic() < deadline:
+            data += scanner.readline()
+            if data.endswith(b"\n"):
+                break
+        return data.decode("utf-8").strip()
 
     def stop(self):
         self.is_running = False
@@ -97,9 +185,30 @@ class BarcodeScanWindow(QMainWindow):
         self.uv_warning = "#FFAB40"  # Warning color
         self.uv_footer = "#666666"  # Footer text
 
+        # Progress bar stylesheets per color band, applied only on band changes
+        self._progress_qss = {
+            band: self._build_progress_qss(color)
+            for band, color in (
+                ("error", self.uv_error),
+                ("warning", self.uv_warning),
+                ("ok", self.uv_primary),
+            )
+        }
+        self._progress_band = None
+
+        # Status message stylesheets per state, applied only on state changes
+        self._status_qss = {
+            "error": f"color: {self.uv_error};",
+            "primary": f"color: {self.uv_primary};",
+            "default": f"color: {self.uv_light};",
+            "success": f"color: {self.uv_secondary};",
+            "warning": f"color: {self.uv_warning};",
+        }
+        self._status_state = None
+
         # Window setup
         self.setWindowTitle("Ultraviolette - Vehicle Identification")
-        self.setWindowIcon(QIcon("assets/small_icon.PNG"))
+        self.setWindowIcon(_icon("assets/small_icon.PNG"))
         self.resize(1280, 840)
         self.setMinimumSize(1000, 700)
 
@@ -109,28 +218,38 @@ class BarcodeScanWindow(QMainWindow):
         # Set dark theme globally
         self.apply_dark_theme()
 
+        # Static widget styles, applied once for the whole window
+        self.load_stylesheet()
+
         # Initialize UI
         self.init_ui()
 
         # Initialize scan thread
         self.scan_thread = None
+        self._stopping_threads = []
+
+        # Help dialog, built on first use
+        self._help_dialog = None
+
+        # Scanner serial port, opened on the GUI thread right after the window is
+        # built and reused per scan; reopened on the next scan after a serial error
+        self.port = "COM3"
+        self.baudrate = 115200
+        self._scanner = None
+        QTimer.singleShot(0, self._warm_serial)
 
         # Animation properties
         self.scan_animation = None
         self.is_scanning = False
 
-        # Pulse animation for scan button
-        self.pulse_timer = QTimer()
-        self.pulse_timer.timeout.connect(self.update_pulse)
-        self.pulse_value = 0
-        self.pulse_direction = 1
-
         # Vehicle info storage
         self.vehicle_info = {
             'vin': '',
             'imei': '',
             'uuid': ''
         }
+        # Values currently shown on the info cards
+        self._last_rendered = None
 
         # Scan state
         self.current_scan_state = "ready"  # ready, scanning, success, error
@@ -138,11 +257,49 @@ class BarcodeScanWindow(QMainWindow):
         # Setup animations
         self.setup_animations()
 
+    def _warm_serial(self):
+        """Pre-open the scanner port so the first scan doesn't pay the open cost"""
+        try:
+            self._scanner = open_scanner(self.port, self.baudrate)
+            self._scanner.reset_input_buffer()
+        except Exception as e:
+            # Scanner not attached yet, the scan thread will open the port itself
+            print(f"Scanner warm-up failed: {str(e)}")
+            self._scanner = None
+
+    def _drop_scanner(self, scanner):
+        """Close a scanner handle that failed so the next scan reopens the port"""
+        try:
+            scanner.close()
+        except Exception as e:
+            print(f"Scanner close failed: {str(e)}")
+        if self._scanner is scanner:
+            self._scanner = None
+
+    def closeEvent(self, event):
+        """Stop any running scan and release the scanner port"""
+        if self.scan_thread and self.scan_thread.isRunning():
+            self.scan_thread.stop()
+        for thread in [self.scan_thread, *self._stopping_threads]:
+            if thread is not None:
+                thread.wait()
+        if self._scanner is not None:
+            self._scanner.close()
+            self._scanner = None
+        self.toast_label.hide()
+        super().closeEvent(event)
+
     def setup_animations(self):
         """Setup various UI animations"""
-        # Scan button pulse animation
-        self.pulse_animation = QPropertyAnimation(self.scan_button, b"geometry")
+        # Scan button pulse animation, run by Qt on an opacity effect
+        self.pulse_effect = QGraphicsOpacityEffect(self.scan_button)
+        self.pulse_effect.setEnabled(False)  # Only composited while pulsing
+        self.scan_button.setGraphicsEffect(self.pulse_effect)
+        self.pulse_animation = QPropertyAnimation(self.pulse_effect, b"opacity")
         self.pulse_animation.setDuration(1000)
+        self.pulse_animation.setKeyValueAt(0.0, 1.0)
+        self.pulse_animation.setKeyValueAt(0.5, 0.5)
+        self.pulse_animation.setKeyValueAt(1.0, 1.0)
         self.pulse_animation.setLoopCount(-1)  # Infinite loop
         self.pulse_animation.setEasingCurve(QEasingCurve.InOutSine)
 
@@ -175,6 +332,14 @@ class BarcodeScanWindow(QMainWindow):
         except Exception as e:
             print(f"Font loading error: {str(e)}")
 
+    def load_stylesheet(self):
+        """Load the window stylesheet shared by all static widgets"""
+        try:
+            with open("assets/style.qss", encoding="utf-8") as qss_file:
+                self.setStyleSheet(qss_file.read())
+        except OSError as e:
+            print(f"Stylesheet loading error: {str(e)}")
+
     def apply_dark_theme(self):
         """Apply enhanced dark theme with modern touches"""
         palette = QPalette()
@@ -207,15 +372,6 @@ class BarcodeScanWindow(QMainWindow):
         # Create a container with gradient background
         bg_container = QWidget()
         bg_container.setObjectName("bgContainer")
-        bg_container.setStyleSheet("""
-            QWidget#bgContainer {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #121212, stop:0.5 #0D0D0D, stop:1 #121212
-                );
-                border-radius: 0px;
-            }
-        """)
 
         # Layout for content on top of gradient
         content_layout = QVBoxLayout(bg_container)
@@ -245,19 +401,13 @@ class BarcodeScanWindow(QMainWindow):
 
         # Logo image or text
         self.logo_label = QLabel()
-        logo_pixmap = QPixmap("assets/ultraviolette_automotive_logo.jpg")
+        logo_pixmap = _cached_scaled_pixmap("assets/ultraviolette_automotive_logo@50.png", 180, 50)
         if not logo_pixmap.isNull():
-            self.logo_label.setPixmap(
-                logo_pixmap.scaled(
-                    180, 50, 
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                )
-            )
+            self.logo_label.setPixmap(logo_pixmap)
         else:
             self.logo_label.setText("ULTRAVIOLETTE")
-            self.logo_label.setFont(QFont("Montserrat", 18, QFont.Bold))
-            self.logo_label.setStyleSheet(f"color: {self.uv_primary};")
+            self.logo_label.setFont(_FONT_18_BOLD)
+            self.logo_label.setObjectName("logoText")
         logo_layout.addWidget(self.logo_label)
         header_layout.addWidget(logo_container)
 
@@ -270,47 +420,21 @@ class BarcodeScanWindow(QMainWindow):
 
         # Help button with modern icon
         self.help_button = QPushButton()
-        self.help_button.setIcon(QIcon("assets/help_icon.png"))
+        self.help_button.setIcon(_icon("assets/help_icon.png"))
         self.help_button.setIconSize(QSize(20, 20))
         self.help_button.setFixedSize(40, 40)
         self.help_button.setCursor(Qt.PointingHandCursor)
         self.help_button.setToolTip("Help")
-        self.help_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_gray};
-                color: {self.uv_light};
-                border: none;
-                border-radius: 20px;
-                padding: 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_primary};
-            }}
-        """)
+        self.help_button.setObjectName("helpButton")
         self.help_button.clicked.connect(self.show_help)
         controls_layout.addWidget(self.help_button)
 
         # Logout button with modern styling
         self.logout_button = QPushButton("Log Out")
-        self.logout_button.setFont(QFont("Montserrat", 10, QFont.Bold))
+        self.logout_button.setFont(_FONT_10_BOLD)
         self.logout_button.setFixedSize(100, 40)
         self.logout_button.setCursor(Qt.PointingHandCursor)
-        self.logout_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.uv_light};
-                border: 2px solid {self.uv_primary};
-                border-radius: 20px;
-                padding: 8px 15px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 195, 255, 0.1);
-                border: 2px solid {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                border: 2px solid {self.uv_pressed};
-            }}
-        """)
+        self.logout_button.setObjectName("logoutButton")
         self.logout_button.clicked.connect(self.logout)
         controls_layout.addWidget(self.logout_button)
 
@@ -321,12 +445,7 @@ class BarcodeScanWindow(QMainWindow):
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Plain)
-        separator.setStyleSheet(f"""
-            background-color: {self.uv_light_gray};
-            min-height: 1px;
-            max-height: 1px;
-            margin: 0px;
-        """)
+        separator.setObjectName("separator")
         parent_layout.addWidget(separator)
 
     def setup_main_content(self, parent_layout):
@@ -353,47 +472,28 @@ class BarcodeScanWindow(QMainWindow):
 
         # Create tab widget with modern styling
         self.tab_widget = QTabWidget()
-        self.tab_widget.setFont(QFont("Montserrat", 10))
-        self.tab_widget.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 1px solid {self.uv_light_gray};
-                border-radius: 8px;
-                top: -1px;
-                background: {self.uv_darker};
-            }}
-            QTabBar::tab {{
-                background: {self.uv_dark};
-                color: {self.uv_light};
-                border: 1px solid {self.uv_light_gray};
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 8px 20px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background: {self.uv_darker};
-                color: {self.uv_primary};
-                border-bottom: 2px solid {self.uv_primary};
-                font-weight: bold;
-            }}
-            QTabBar::tab:hover {{
-                background: {self.uv_gray};
-            }}
-        """)
+        self.tab_widget.setFont(_FONT_10)
+        self.tab_widget.setObjectName("scanTabs")
 
         # Create scan tab
         scan_tab = QWidget()
         self.tab_widget.addTab(scan_tab, " Scan Barcode ")
         self.setup_scan_tab(scan_tab)
 
-        # Create manual entry tab
-        manual_tab = QWidget()
-        self.tab_widget.addTab(manual_tab, " Manual Entry ")
-        self.setup_manual_tab(manual_tab)
+        # Create manual entry tab, built the first time it is selected
+        self.manual_tab = QWidget()
+        self._manual_built = False
+        self.tab_widget.addTab(self.manual_tab, " Manual Entry ")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         scan_layout.addWidget(self.tab_widget)
 
+    def _on_tab_changed(self, index):
+        """Build the manual entry tab on first use"""
+        if index == self.tab_widget.indexOf(self.manual_tab) and not self._manual_built:
+            self.setup_manual_tab(self.manual_tab)
+            self._manual_built = True
+
     def setup_results_view(self):
         """Set up the results view that shows after scanning"""
         results_layout = QVBoxLayout(self.results_view)
@@ -406,20 +506,9 @@ class BarcodeScanWindow(QMainWindow):
 
         # Back button
         self.back_button = QPushButton("← Back to Scan")
-        self.back_button.setFont(QFont("Montserrat", 12))
+        self.back_button.setFont(_FONT_12)
         self.back_button.setCursor(Qt.PointingHandCursor)
-        self.back_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.uv_primary};
-                border: none;
-                padding: 8px 15px;
-            }}
-            QPushButton:hover {{
-                color: {self.uv_hover};
-                text-decoration: underline;
-            }}
-        """)
+        self.back_button.setObjectName("backButton")
         self.back_button.clicked.connect(self.show_scan_view)
         header_layout.addWidget(self.back_button)
         header_layout.addStretch()
@@ -428,15 +517,11 @@ class BarcodeScanWindow(QMainWindow):
         # Main content area with splitter
         splitter = QSplitter(Qt.Vertical)
         splitter.setHandleWidth(1)
-        splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background: {self.uv_light_gray};
-            }}
-        """)
+        splitter.setObjectName("resultsSplitter")
 
         # Vehicle info section (top)
         vehicle_info_container = QWidget()
-        vehicle_info_container.setStyleSheet("background: transparent;")
+        vehicle_info_container.setObjectName("transparentContainer")
         vehicle_info_layout = QVBoxLayout(vehicle_info_container)
         vehicle_info_layout.setContentsMargins(0, 0, 0, 0)
         vehicle_info_layout.setSpacing(20)
@@ -445,52 +530,53 @@ class BarcodeScanWindow(QMainWindow):
         title_layout = QHBoxLayout()
         title_layout.setAlignment(Qt.AlignLeft)
         info_icon = QLabel()
-        info_icon.setPixmap(QPixmap("assets/info_icon.png").scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        info_icon.setPixmap(_cached_scaled_pixmap("assets/info_icon.png", 24, 24))
         title_layout.addWidget(info_icon)
         title_layout.addSpacing(10)
         title_label = QLabel("Vehicle Information")
-        title_label.setFont(QFont("Montserrat", 18, QFont.Bold))
+        title_label.setFont(_FONT_18_BOLD)
         title_layout.addWidget(title_label)
         title_layout.addStretch()
         vehicle_info_layout.addLayout(title_layout)
 
         # Vehicle info cards (using grid layout for better organization)
         self.info_cards_container = QWidget()
+        self.info_cards_container.setObjectName("scrollContent")
         self.info_cards_layout = QGridLayout(self.info_cards_container)
         self.info_cards_layout.setContentsMargins(0, 0, 0, 0)
         self.info_cards_layout.setSpacing(20)
         self.info_cards_layout.setColumnStretch(0, 1)
         self.info_cards_layout.setColumnStretch(1, 1)
+        self._build_info_card_pool()
+
+        # Save result message, shown below the cards and reused for every save
+        self.save_feedback_label = QLabel()
+        self.save_feedback_label.setFont(_FONT_11)
+        self.save_feedback_label.setAlignment(Qt.AlignCenter)
+        self.save_feedback_label.hide()
+        self.info_cards_layout.addWidget(self.save_feedback_label, 2, 0, 1, 2)
+        self._save_feedback_timer = QTimer(self)
+        self._save_feedback_timer.setSingleShot(True)
+        self._save_feedback_timer.timeout.connect(self.save_feedback_label.hide)
+
+        # Floating toast shared by all transient feedback (e.g. "Copied!")
+        self.toast_label = QLabel(self, flags=Qt.ToolTip | Qt.FramelessWindowHint)
+        self.toast_label.setFont(_FONT_10)
+        self.toast_label.setObjectName("toastLabel")
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self.toast_label.hide)
 
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #2D2D2D;
-                width: 8px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #444444;
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        scroll_area.setObjectName("cardScrollArea")
         scroll_area.setWidget(self.info_cards_container)
         vehicle_info_layout.addWidget(scroll_area)
         splitter.addWidget(vehicle_info_container)
 
         # Action buttons section (bottom)
         action_buttons_container = QWidget()
-        action_buttons_container.setStyleSheet("background: transparent;")
+        action_buttons_container.setObjectName("transparentContainer")
         action_buttons_layout = QVBoxLayout(action_buttons_container)
         action_buttons_layout.setContentsMargins(0, 20, 0, 0)
         action_buttons_layout.setSpacing(20)
@@ -502,99 +588,41 @@ class BarcodeScanWindow(QMainWindow):
 
         # Continue with Analysis button
         self.continue_button = QPushButton("Continue with Analysis")
-        self.continue_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        self.continue_button.setFont(_FONT_12_BOLD)
         self.continue_button.setCursor(Qt.PointingHandCursor)
         self.continue_button.setFixedSize(220, 50)
-        self.continue_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_primary};
-                color: {self.uv_dark};
-                border: none;
-                border-radius: 25px;
-                padding: 12px 30px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.uv_pressed};
-            }}
-        """)
-        self.continue_button.setIcon(QIcon("assets/analysis_icon.png"))
+        self.continue_button.setObjectName("primaryButton")
+        self.continue_button.setIcon(_icon("assets/analysis_icon.png"))
         self.continue_button.clicked.connect(self.continue_with_analysis)
         button_row.addWidget(self.continue_button)
 
         # Rescan button
         self.rescan_button = QPushButton("Rescan")
-        self.rescan_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        self.rescan_button.setFont(_FONT_12_BOLD)
         self.rescan_button.setCursor(Qt.PointingHandCursor)
         self.rescan_button.setFixedSize(220, 50)
-        self.rescan_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.uv_light};
-                border: 2px solid {self.uv_primary};
-                border-radius: 25px;
-                padding: 12px 30px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 195, 255, 0.15);
-                border: 2px solid {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                border: 2px solid {self.uv_pressed};
-            }}
-        """)
-        self.rescan_button.setIcon(QIcon("assets/rescan_icon.png"))
+        self.rescan_button.setObjectName("outlineButton")
+        self.rescan_button.setIcon(_icon("assets/rescan_icon.png"))
         self.rescan_button.clicked.connect(self.reset_scan_ui)
         button_row.addWidget(self.rescan_button)
 
         # Save button
         self.save_button = QPushButton("Save Information")
-        self.save_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        self.save_button.setFont(_FONT_12_BOLD)
         self.save_button.setCursor(Qt.PointingHandCursor)
         self.save_button.setFixedSize(220, 50)
-        self.save_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_primary};
-                color: {self.uv_dark};
-                border: none;
-                border-radius: 25px;
-                padding: 12px 30px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.uv_pressed};
-            }}
-        """)
-        self.save_button.setIcon(QIcon("assets/save_icon.png"))
+        self.save_button.setObjectName("primaryButton")
+        self.save_button.setIcon(_icon("assets/save_icon.png"))
         self.save_button.clicked.connect(self.save_vehicle_info)
         button_row.addWidget(self.save_button)
 
         # Clear button
         self.clear_button = QPushButton("Clear")
-        self.clear_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        self.clear_button.setFont(_FONT_12_BOLD)
         self.clear_button.setCursor(Qt.PointingHandCursor)
         self.clear_button.setFixedSize(220, 50)
-        self.clear_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.uv_light};
-                border: 2px solid {self.uv_primary};
-                border-radius: 25px;
-                padding: 12px 30px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 195, 255, 0.15);
-                border: 2px solid {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                border: 2px solid {self.uv_pressed};
-            }}
-        """)
-        self.clear_button.setIcon(QIcon("assets/clear_icon.png"))
+        self.clear_button.setObjectName("outlineButton")
+        self.clear_button.setIcon(_icon("assets/clear_icon.png"))
         self.clear_button.clicked.connect(self.clear_vehicle_info)
         button_row.addWidget(self.clear_button)
 
@@ -627,11 +655,7 @@ class BarcodeScanWindow(QMainWindow):
         # Title badge with gradient
         title_badge = QLabel()
         title_badge.setFixedSize(8, 50)
-        title_badge.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                      stop:0 {self.uv_primary}, stop:1 {self.uv_hover});
-            border-radius: 4px;
-        """)
+        title_badge.setObjectName("titleBadge")
         title_layout.addWidget(title_badge)
         title_layout.addSpacing(15)
 
@@ -639,12 +663,12 @@ class BarcodeScanWindow(QMainWindow):
         title_container = QVBoxLayout()
         title_container.setSpacing(5)
         title = QLabel("Vehicle Identification")
-        title.setFont(QFont("Montserrat", 22, QFont.Bold))
-        title.setStyleSheet(f"color: {self.uv_light};")
+        title.setFont(_FONT_22_BOLD)
+        title.setObjectName("sectionTitle")
         title_container.addWidget(title)
         subtitle = QLabel("Scan the vehicle barcode to begin")
-        subtitle.setFont(QFont("Montserrat", 12))
-        subtitle.setStyleSheet("color: #AAAAAA;")
+        subtitle.setFont(_FONT_12)
+        subtitle.setObjectName("mutedText")
         title_container.addWidget(subtitle)
         title_layout.addLayout(title_container)
         title_layout.addStretch()
@@ -654,20 +678,6 @@ class BarcodeScanWindow(QMainWindow):
         scan_card = QFrame()
         scan_card.setObjectName("scanCard")
 
-        # Add shadow effect
-        card_shadow = QGraphicsDropShadowEffect()
-        card_shadow.setBlurRadius(30)
-        card_shadow.setColor(QColor(0, 0, 0, 100))
-        card_shadow.setOffset(0, 5)
-        scan_card.setGraphicsEffect(card_shadow)
-        scan_card.setStyleSheet(f"""
-            QFrame#scanCard {{
-                background: {self.uv_darker};
-                border: 1px solid {self.uv_light_gray};
-                border-radius: 12px;
-            }}
-        """)
-
         scan_layout = QVBoxLayout(scan_card)
         scan_layout.setContentsMargins(40, 40, 40, 40)
         scan_layout.setSpacing(30)
@@ -676,45 +686,27 @@ class BarcodeScanWindow(QMainWindow):
         # Scan image container with animated border
         self.scan_image_container = QFrame()
         self.scan_image_container.setFixedSize(220, 220)
-        self.scan_image_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.uv_gray};
-                border-radius: 110px;
-                border: 2px solid {self.uv_primary};
-            }}
-        """)
+        self.scan_image_container.setObjectName("scanImageContainer")
         scan_image_layout = QVBoxLayout(self.scan_image_container)
         scan_image_layout.setContentsMargins(20, 20, 20, 20)
 
         # Scan image or animation
         self.scan_image = QLabel()
-        scan_pixmap = QPixmap("assets/barcode_scan.png")
+        scan_pixmap = _cached_scaled_pixmap("assets/barcode_scan@160.png", 160, 160)
         if scan_pixmap.isNull():
             self.scan_image.setText("[ Scan ]")
-            self.scan_image.setStyleSheet(f"""
-                color: {self.uv_primary};
-                font-size: 16px;
-                padding: 40px;
-                border: none;
-            """)
+            self.scan_image.setObjectName("scanImageText")
             self.scan_image.setAlignment(Qt.AlignCenter)
         else:
-            self.scan_image.setPixmap(
-                scan_pixmap.scaled(
-                    160, 160, 
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                )
-            )
-            self.scan_image.setStyleSheet("background: transparent; border: none;")
+            self.scan_image.setPixmap(scan_pixmap)
             self.scan_image.setAlignment(Qt.AlignCenter)
         scan_image_layout.addWidget(self.scan_image)
         scan_layout.addWidget(self.scan_image_container, alignment=Qt.AlignCenter)
 
         # Scan instructions with animation
         self.scan_instructions = QLabel("Position the barcode scanner over the vehicle's barcode")
-        self.scan_instructions.setFont(QFont("Montserrat", 12))
-        self.scan_instructions.setStyleSheet(f"color: {self.uv_light}; margin-top: 10px;")
+        self.scan_instructions.setFont(_FONT_12)
+        self.scan_instructions.setObjectName("scanInstructions")
         self.scan_instructions.setAlignment(Qt.AlignCenter)
         scan_layout.addWidget(self.scan_instructions)
 
@@ -725,24 +717,16 @@ class BarcodeScanWindow(QMainWindow):
         self.scan_progress.setTextVisible(False)
         self.scan_progress.setFixedHeight(6)
         self.scan_progress.setFixedWidth(300)
-        self.scan_progress.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {self.uv_gray};
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.uv_primary};
-                border-radius: 3px;
-            }}
-        """)
+        self.scan_progress.setStyleSheet(self._progress_qss["ok"])
+        self._progress_band = "ok"
         scan_layout.addWidget(self.scan_progress, alignment=Qt.AlignCenter)
         self.scan_progress.hide()
 
         # Status message
         self.status_message = QLabel("Ready to scan")
-        self.status_message.setFont(QFont("Montserrat", 11))
+        self.status_message.setFont(_FONT_11)
         self.status_message.setAlignment(Qt.AlignCenter)
-        self.status_message.setStyleSheet(f"color: {self.uv_primary};")
+        self.set_status_state("primary")
         scan_layout.addWidget(self.status_message)
 
         # Button layout
@@ -752,28 +736,13 @@ class BarcodeScanWindow(QMainWindow):
 
         # Scan button with modern styling
         self.scan_button = QPushButton("Start Scanning")
-        self.scan_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        self.scan_button.setFont(_FONT_12_BOLD)
         self.scan_button.setFixedSize(220, 50)
         self.scan_button.setCursor(Qt.PointingHandCursor)
-        self.scan_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_primary};
-                color: {self.uv_dark};
-                border: none;
-                border-radius: 25px;
-                padding: 12px 30px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.uv_pressed};
-            }}
-        """)
+        self.scan_button.setObjectName("primaryButton")
 
         # Add scan icon if available
-        scan_icon = QIcon("assets/scan_icon.png")
+        scan_icon = _icon("assets/scan_icon.png")
         if not scan_icon.isNull():
             self.scan_button.setIcon(scan_icon)
             self.scan_button.setIconSize(QSize(20, 20))
@@ -782,25 +751,10 @@ class BarcodeScanWindow(QMainWindow):
 
         # Cancel button
         self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        self.cancel_button.setFont(_FONT_12_BOLD)
         self.cancel_button.setFixedWidth(150)
         self.cancel_button.setCursor(Qt.PointingHandCursor)
-        self.cancel_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {self.uv_light};
-                border: 2px solid {self.uv_primary};
-                border-radius: 25px;
-                padding: 12px 30px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 195, 255, 0.15);
-                border: 2px solid {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                border: 2px solid {self.uv_pressed};
-            }}
-        """)
+        self.cancel_button.setObjectName("outlineButton")
         self.cancel_button.clicked.connect(self.cancel_scan)
         self.cancel_button.hide()
         button_layout.addWidget(self.cancel_button)
@@ -821,11 +775,7 @@ class BarcodeScanWindow(QMainWindow):
         # Title badge with gradient
         title_badge = QLabel()
         title_badge.setFixedSize(8, 50)
-        title_badge.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                      stop:0 {self.uv_primary}, stop:1 {self.uv_hover});
-            border-radius: 4px;
-        """)
+        title_badge.setObjectName("titleBadge")
         title_layout.addWidget(title_badge)
         title_layout.addSpacing(15)
 
@@ -833,12 +783,12 @@ class BarcodeScanWindow(QMainWindow):
         title_container = QVBoxLayout()
         title_container.setSpacing(5)
         title = QLabel("Manual Entry")
-        title.setFont(QFont("Montserrat", 22, QFont.Bold))
-        title.setStyleSheet(f"color: {self.uv_light};")
+        title.setFont(_FONT_22_BOLD)
+        title.setObjectName("sectionTitle")
         title_container.addWidget(title)
         subtitle = QLabel("Enter vehicle information manually")
-        subtitle.setFont(QFont("Montserrat", 12))
-        subtitle.setStyleSheet("color: #AAAAAA;")
+        subtitle.setFont(_FONT_12)
+        subtitle.setObjectName("mutedText")
         title_container.addWidget(subtitle)
         title_layout.addLayout(title_container)
         title_layout.addStretch()
@@ -848,20 +798,6 @@ class BarcodeScanWindow(QMainWindow):
         manual_card = QFrame()
         manual_card.setObjectName("manualCard")
 
-        # Add shadow effect
-        card_shadow = QGraphicsDropShadowEffect()
-        card_shadow.setBlurRadius(30)
-        card_shadow.setColor(QColor(0, 0, 0, 100))
-        card_shadow.setOffset(0, 5)
-        manual_card.setGraphicsEffect(card_shadow)
-        manual_card.setStyleSheet(f"""
-            QFrame#manualCard {{
-                background: {self.uv_darker};
-                border: 1px solid {self.uv_light_gray};
-                border-radius: 12px;
-            }}
-        """)
-
         manual_layout = QVBoxLayout(manual_card)
         manual_layout.setContentsMargins(40, 40, 40, 40)
         manual_layout.setSpacing(25)
@@ -874,68 +810,32 @@ class BarcodeScanWindow(QMainWindow):
 
         # VIN input with modern styling
         vin_label = QLabel("VIN:")
-        vin_label.setFont(QFont("Montserrat", 12, QFont.Bold))
+        vin_label.setFont(_FONT_12_BOLD)
         self.vin_input = QLineEdit()
         self.vin_input.setPlaceholderText("Enter Vehicle Identification Number")
         self.vin_input.setMaxLength(17)
-        self.vin_input.setFont(QFont("Montserrat", 11))
-        self.vin_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.uv_gray};
-                border: 1px solid #444444;
-                border-radius: 6px;
-                padding: 12px 15px;
-                color: {self.uv_light};
-                selection-background-color: {self.uv_primary};
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {self.uv_primary};
-            }}
-        """)
+        self.vin_input.setFont(_FONT_11)
+        self.vin_input.setObjectName("entryInput")
         form_layout.addRow(vin_label, self.vin_input)
 
         # IMEI input
         imei_label = QLabel("IMEI:")
-        imei_label.setFont(QFont("Montserrat", 12, QFont.Bold))
+        imei_label.setFont(_FONT_12_BOLD)
         self.imei_input = QLineEdit()
         self.imei_input.setPlaceholderText("Enter IMEI Number")
         self.imei_input.setMaxLength(15)
-        self.imei_input.setFont(QFont("Montserrat", 11))
-        self.imei_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.uv_gray};
-                border: 1px solid #444444;
-                border-radius: 6px;
-                padding: 12px 15px;
-                color: {self.uv_light};
-                selection-background-color: {self.uv_primary};
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {self.uv_primary};
-            }}
-        """)
+        self.imei_input.setFont(_FONT_11)
+        self.imei_input.setObjectName("entryInput")
         form_layout.addRow(imei_label, self.imei_input)
 
         # UUID input
         uuid_label = QLabel("UUID:")
-        uuid_label.setFont(QFont("Montserrat", 12, QFont.Bold))
+        uuid_label.setFont(_FONT_12_BOLD)
         self.uuid_input = QLineEdit()
         self.uuid_input.setPlaceholderText("Enter UUID")
         self.uuid_input.setMaxLength(36)
-        self.uuid_input.setFont(QFont("Montserrat", 11))
-        self.uuid_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.uv_gray};
-                border: 1px solid #444444;
-                border-radius: 6px;
-                padding: 12px 15px;
-                color: {self.uv_light};
-                selection-background-color: {self.uv_primary};
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {self.uv_primary};
-            }}
-        """)
+        self.uuid_input.setFont(_FONT_11)
+        self.uuid_input.setObjectName("entryInput")
         form_layout.addRow(uuid_label, self.uuid_input)
 
         manual_layout.addLayout(form_layout)
@@ -944,33 +844,18 @@ class BarcodeScanWindow(QMainWindow):
         info_label = QLabel(
             "Enter the vehicle information fields above. All fields are optional but at least one is required."
         )
-        info_label.setFont(QFont("Montserrat", 10))
-        info_label.setStyleSheet("color: #AAAAAA;")
+        info_label.setFont(_FONT_10)
+        info_label.setObjectName("mutedText")
         info_label.setWordWrap(True)
         manual_layout.addWidget(info_label)
 
         # Submit button with modern styling
         self.submit_button = QPushButton("Submit Information")
-        self.submit_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        self.submit_button.setFont(_FONT_12_BOLD)
         self.submit_button.setFixedSize(220, 50)
         self.submit_button.setCursor(Qt.PointingHandCursor)
-        self.submit_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_primary};
-                color: {self.uv_dark};
-                border: none;
-                border-radius: 25px;
-                padding: 12px 30px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.uv_pressed};
-            }}
-        """)
-        self.submit_button.setIcon(QIcon("assets/submit_icon.png"))
+        self.submit_button.setObjectName("primaryButton")
+        self.submit_button.setIcon(_icon("assets/submit_icon.png"))
         self.submit_button.clicked.connect(self.submit_manual_info)
         manual_layout.addWidget(self.submit_button, alignment=Qt.AlignCenter)
 
@@ -981,43 +866,15 @@ class BarcodeScanWindow(QMainWindow):
         footer_layout = QHBoxLayout()
         footer_layout.setContentsMargins(0, 20, 0, 0)
         version_label = QLabel("Ultraviolette Dashboard v1.2.0")
-        version_label.setFont(QFont("Montserrat", 9))
-        version_label.setStyleSheet(f"color: {self.uv_footer};")
+        version_label.setFont(_FONT_9)
+        version_label.setObjectName("footerText")
         footer_layout.addWidget(version_label, alignment=Qt.AlignLeft)
         copyright_label = QLabel("© 2025 Ultraviolette Automotive")
-        copyright_label.setFont(QFont("Montserrat", 9))
-        copyright_label.setStyleSheet(f"color: {self.uv_footer};")
+        copyright_label.setFont(_FONT_9)
+        copyright_label.setObjectName("footerText")
         footer_layout.addWidget(copyright_label, alignment=Qt.AlignRight)
         parent_layout.addLayout(footer_layout)
 
-    def update_pulse(self):
-        """Update the pulse animation for the scan button"""
-        self.pulse_value += 0.05 * self.pulse_direction
-        if self.pulse_value >= 1.0:
-            self.pulse_value = 1.0
-            self.pulse_direction = -1
-        elif self.pulse_value <= 0.0:
-            self.pulse_value = 0.0
-            self.pulse_direction = 1
-        # Calculate opacity based on pulse value
-        opacity = 0.5 + 0.5 * self.pulse_value
-        self.scan_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_primary};
-                color: {self.uv_dark};
-                border: none;
-                border-radius: 25px;
-                padding: 12px 30px;
-                border: 2px solid rgba(0, 195, 255, {opacity});
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.uv_pressed};
-            }}
-        """)
-
     def start_scan(self):
         """Start the barcode scanning process with enhanced UI feedback"""
         # Update UI for scanning state
@@ -1029,11 +886,16 @@ class BarcodeScanWindow(QMainWindow):
         self.scan_progress.show()
         self.scan_progress.setValue(0)
         self.status_message.setText("Initializing scanner...")
-        self.status_message.setStyleSheet(f"color: {self.uv_primary};")
+        self.set_status_state("primary")
         # Start the pulse animation
-        self.pulse_timer.start(50)
+        self.pulse_effect.setEnabled(True)
+        self.pulse_animation.start()
+        # Reopen the port if the held handle was lost (e.g. scanner replugged)
+        if self._scanner is None:
+            self._warm_serial()
         # Initialize and start the scan thread
-        self.scan_thread = BarcodeScanThread()
+        self.scan_thread = BarcodeScanThread(self.port, self.baudrate, scanner=self._scanner)
+        self.scan_thread.scanner_lost.connect(self._drop_scanner)
         self.scan_thread.scan_complete.connect(self.handle_scan_complete)
         self.scan_thread.scan_error.connect(self.handle_scan_error)
         self.scan_thread.scan_progress.connect(self.update_scan_progress)
@@ -1044,25 +906,45 @@ class BarcodeScanWindow(QMainWindow):
         """Update the status message during scanning"""
         self.status_message.setText(status)
         # Change color based on status
-        if "error" in status.lower():
-            self.status_message.setStyleSheet(f"color: {self.uv_error};")
-        elif "ready" in status.lower():
-            self.status_message.setStyleSheet(f"color: {self.uv_primary};")
+        lowered = status.lower()
+        if "error" in lowered:
+            self.set_status_state("error")
+        elif "ready" in lowered:
+            self.set_status_state("primary")
         else:
-            self.status_message.setStyleSheet(f"color: {self.uv_light};")
+            self.set_status_state("default")
+
+    def set_status_state(self, state):
+        """Apply the cached status message stylesheet if the state changed"""
+        if state != self._status_state:
+            self.status_message.setStyleSheet(self._status_qss[state])
+            self._status_state = state
 
     def cancel_scan(self):
         """Cancel the current scanning process with smooth UI transition"""
         if self.scan_thread and self.scan_thread.isRunning():
+            # Let the worker leave its loop on its own instead of killing it
             self.scan_thread.stop()
-            self.scan_thread.terminate()
+            if not self.scan_thread.wait(200):
+                # Still inside a serial read, keep it alive until it returns. It shares
+                # the scanner handle, so no new scan starts until it has finished
+                thread = self.scan_thread
+                self._stopping_threads.append(thread)
+                thread.finished.connect(lambda: self._scan_thread_stopped(thread))
+                self.scan_button.setEnabled(False)
             self.scan_thread = None
         self.reset_scan_ui()
         self.status_message.setText("Scan cancelled")
-        self.status_message.setStyleSheet(f"color: {self.uv_error};")
+        self.set_status_state("error")
         # Fade out the status message after delay
         QTimer.singleShot(2000, self.fade_status_message)
 
+    def _scan_thread_stopped(self, thread):
+        """Forget a cancelled scan thread and allow scanning once none are left"""
+        self._stopping_threads.remove(thread)
+        if not self._stopping_threads:
+            self.scan_button.setEnabled(True)
+
     def fade_status_message(self):
         """Fade out the status message"""
         self.status_fade_animation.start()
@@ -1075,68 +957,47 @@ class BarcodeScanWindow(QMainWindow):
         self.scan_button.show()
         self.cancel_button.hide()
         self.scan_progress.hide()
-        self.pulse_timer.stop()
+        self.pulse_animation.stop()
+        self.pulse_effect.setEnabled(False)
         # Reset status message after delay if not already set
         if self.status_message.text() in ("", "Ready to scan"):
             self.status_message.setText("Ready to scan")
-            self.status_message.setStyleSheet(f"color: {self.uv_primary};")
+            self.set_status_state("primary")
+
+    def _build_progress_qss(self, chunk_color):
+        """Build the scan progress bar stylesheet for a chunk color"""
+        return f"""
+            QProgressBar {{
+                background-color: {self.uv_gray};
+                border-radius: 3px;
+            }}
+            QProgressBar::chunk {{
+                background-color: {chunk_color};
+                border-radius: 3px;
+            }}
+        """
 
     def update_scan_progress(self, value):
         """Update the progress bar during scanning"""
         self.scan_progress.setValue(value)
         # Change color based on progress
         if value < 30:
-            self.scan_progress.setStyleSheet(f"""
-                QProgressBar {{
-                    background-color: {self.uv_gray};
-                    border-radius: 3px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {self.uv_error};
-                    border-radius: 3px;
-                }}
-            """)
+            band = "error"
         elif value < 70:
-            self.scan_progress.setStyleSheet(f"""
-                QProgressBar {{
-                    background-color: {self.uv_gray};
-                    border-radius: 3px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {self.uv_warning};
-                    border-radius: 3px;
-                }}
-            """)
+            band = "warning"
         else:
-            self.scan_progress.setStyleSheet(f"""
-                QProgressBar {{
-                    background-color: {self.uv_gray};
-                    border-radius: 3px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {self.uv_primary};
-                    border-radius: 3px;
-                }}
-            """)
-
-    def handle_scan_complete(self, barcode):
+            band = "ok"
+        if band != self._progress_band:
+            self.scan_progress.setStyleSheet(self._progress_qss[band])
+            self._progress_band = band
+
+    def handle_scan_complete(self, barcode, parsed_data):
         """Handle successful barcode scan with enhanced UI feedback"""
         global SCANNED_BARCODE
         # Store the scanned barcode
         SCANNED_BARCODE = barcode
-        # Parse the barcode data
-        try:
-            parts = barcode.split(';')
-            parsed_data = {}
-            for part in parts:
-                key, value = part.split(':')
-                parsed_data[key.lower()] = value.strip()
-            self.vehicle_info['vin'] = parsed_data.get('vin', '')
-            self.vehicle_info['imei'] = parsed_data.get('imei', '')
-            self.vehicle_info['uuid'] = parsed_data.get('uuid', '')
-        except Exception as e:
-            print(f"Error parsing barcode: {str(e)}")
-            self.vehicle_info['uuid'] = barcode
+        # Fields were already parsed by the scan thread
+        self.vehicle_info.update(parsed_data)
         # Display the vehicle information in results view
         self.display_vehicle_info()
         # Switch to results view
@@ -1144,102 +1005,99 @@ class BarcodeScanWindow(QMainWindow):
         # Emit the scanned data
         self.scan_successful.emit(self.vehicle_info)
 
+    def _build_info_card_pool(self):
+        """Create the VIN/IMEI/UUID info cards once, hidden until there is a value"""
+        self._info_cards = {}
+        self._info_value_labels = {}
+        self._info_card_positions = {}
+        for row, (key, title) in enumerate((("vin", "VIN"), ("imei", "IMEI"), ("uuid", "UUID"))):
+            card, value_label = self.build_info_card(key, title, f"assets/{key}_icon.png")
+            card.hide()
+            position = divmod(row, 2)
+            self.info_cards_layout.addWidget(card, *position)
+            self._info_cards[key] = card
+            self._info_value_labels[key] = value_label
+            self._info_card_positions[key] = position
+
     def display_vehicle_info(self):
         """Display the vehicle information in a modern card layout"""
-        # Clear previous info cards
-        for i in reversed(range(self.info_cards_layout.count())):
-            widget = self.info_cards_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        # Add vehicle info cards in a grid layout
-        row = 0
-        col = 0
-        if self.vehicle_info['vin']:
-            self.add_info_card(row, col, "VIN", self.vehicle_info['vin'], "assets/vin_icon.png")
-            col += 1
-            if col > 1:
-                col = 0
-                row += 1
-        if self.vehicle_info['imei']:
-            self.add_info_card(row, col, "IMEI", self.vehicle_info['imei'], "assets/imei_icon.png")
-            col += 1
-            if col > 1:
-                col = 0
-                row += 1
-        if self.vehicle_info['uuid']:
-            self.add_info_card(row, col, "UUID", self.vehicle_info['uuid'], "assets/uuid_icon.png")
-
-    def add_info_card(self, row, col, title, value, icon_path=None):
-        """Add an information card to the grid layout"""
+        # Nothing to do if the cards already show these values
+        rendered = tuple(self.vehicle_info.values())
+        if rendered == self._last_rendered:
+            return
+        self._last_rendered = rendered
+        # Hold repaints until every card is updated, then paint once
+        self.info_cards_container.setUpdatesEnabled(False)
+        try:
+            # Fill the pooled cards in grid order, skipping empty values
+            index = 0
+            for key, card in self._info_cards.items():
+                value = self.vehicle_info[key]
+                if value:
+                    self._info_value_labels[key].setText(value)
+                    position = divmod(index, 2)
+                    if self._info_card_positions[key] != position:
+                        self.info_cards_layout.removeWidget(card)
+                        self.info_cards_layout.addWidget(card, *position)
+                        self._info_card_positions[key] = position
+                    index += 1
+                card.setVisible(bool(value))
+        finally:
+            self.info_cards_container.setUpdatesEnabled(True)
+            self.info_cards_container.update()
+
+    def build_info_card(self, key, title, icon_path=None):
+        """Build an information card and return it with its value label"""
         card = QFrame()
         card.setObjectName("infoCard")
-        card.setStyleSheet(f"""
-            QFrame#infoCard {{
-                background: {self.uv_gray};
-                border-radius: 8px;
-                border: 1px solid {self.uv_light_gray};
-            }}
-        """)
         card_layout = QHBoxLayout(card)
         card_layout.setContentsMargins(20, 20, 20, 20)
         card_layout.setSpacing(20)
         # Add icon if available
-        if icon_path and os.path.exists(icon_path):
+        if icon_path and os.path.basename(icon_path) in _asset_names():
             icon_label = QLabel()
-            icon_label.setPixmap(QPixmap(icon_path).scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            icon_label.setPixmap(_cached_scaled_pixmap(icon_path, 24, 24))
             card_layout.addWidget(icon_label)
         # Add title and value
         text_layout = QVBoxLayout()
         text_layout.setSpacing(10)
         title_label = QLabel(title)
-        title_label.setFont(QFont("Montserrat", 12, QFont.Bold))
-        title_label.setStyleSheet(f"color: {self.uv_primary};")
+        title_label.setFont(_FONT_12_BOLD)
+        title_label.setObjectName("cardTitle")
         text_layout.addWidget(title_label)
-        value_label = QLabel(value)
-        value_label.setFont(QFont("Montserrat", 14))
-        value_label.setStyleSheet(f"color: {self.uv_light};")
+        value_label = QLabel()
+        value_label.setFont(_FONT_14)
+        value_label.setObjectName("cardText")
         value_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         text_layout.addWidget(value_label)
         card_layout.addLayout(text_layout)
         card_layout.addStretch()
         # Add copy button
         copy_button = QPushButton()
-        copy_button.setIcon(QIcon("assets/copy_icon.png"))
+        copy_button.setIcon(_icon("assets/copy_icon.png"))
         copy_button.setIconSize(QSize(16, 16))
         copy_button.setFixedSize(32, 32)
         copy_button.setCursor(Qt.PointingHandCursor)
-        copy_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_primary};
-                border-radius: 16px;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_hover};
-            }}
-        """)
-        copy_button.clicked.connect(lambda _, v=value: self.copy_to_clipboard(v))
+        copy_button.setObjectName("copyButton")
+        copy_button.clicked.connect(lambda _, k=key: self.copy_to_clipboard(self.vehicle_info[k]))
         card_layout.addWidget(copy_button)
-        self.info_cards_layout.addWidget(card, row, col)
+        return card, value_label
 
     def copy_to_clipboard(self, text):
         """Copy text to clipboard and show feedback"""
         clipboard = QApplication.clipboard()
         clipboard.setText(text)
         # Show temporary feedback
-        feedback = QLabel("Copied!")
-        feedback.setFont(QFont("Montserrat", 10))
-        feedback.setStyleSheet(f"""
-            background-color: {self.uv_secondary};
-            color: {self.uv_dark};
-            padding: 4px 8px;
-            border-radius: 4px;
-        """)
-        feedback.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        feedback.move(QCursor.pos() + QPoint(15, 15))
-        feedback.show()
-        # Hide after delay
-        QTimer.singleShot(1000, feedback.hide)
+        self.show_toast("Copied!")
+
+    def show_toast(self, text, duration=1000):
+        """Show a short message next to the cursor"""
+        self.toast_label.setText(text)
+        self.toast_label.adjustSize()
+        self.toast_label.move(QCursor.pos() + QPoint(15, 15))
+        self.toast_label.show()
+        # Hide after delay, restarting the countdown on repeated calls
+        self._toast_timer.start(duration)
 
     def continue_with_analysis(self):
         """Handle the 'Continue with Analysis' button click"""
@@ -1265,7 +1123,7 @@ class BarcodeScanWindow(QMainWindow):
         """Handle scanning errors with enhanced UI feedback"""
         self.reset_scan_ui()
         self.status_message.setText(f"✗ {error_message}")
-        self.status_message.setStyleSheet(f"color: {self.uv_error};")
+        self.set_status_state("error")
         QTimer.singleShot(2000, self.fade_status_message)
 
     def submit_manual_info(self):
@@ -1277,7 +1135,7 @@ class BarcodeScanWindow(QMainWindow):
         # Validate - at least one field should have a value
         if not (vin or imei or uuid):
             self.status_message.setText("Please enter at least one field")
-            self.status_message.setStyleSheet(f"color: {self.uv_error};")
+            self.set_status_state("error")
             return
         # Store the values
         self.vehicle_info['vin'] = vin
@@ -1285,11 +1143,12 @@ class BarcodeScanWindow(QMainWindow):
         self.vehicle_info['uuid'] = uuid
         # Display success message
         self.status_message.setText("✓ Information submitted successfully!")
-        self.status_message.setStyleSheet(f"color: {self.uv_secondary};")
-        # Clear input fields
-        self.vin_input.clear()
-        self.imei_input.clear()
-        self.uuid_input.clear()
+        self.set_status_state("success")
+        # Clear input fields without emitting a textChanged per field
+        with QSignalBlocker(self.vin_input), QSignalBlocker(self.imei_input), QSignalBlocker(self.uuid_input):
+            self.vin_input.clear()
+            self.imei_input.clear()
+            self.uuid_input.clear()
         # Display the vehicle information in results view
         self.display_vehicle_info()
         # Switch to results view
@@ -1301,7 +1160,7 @@ class BarcodeScanWindow(QMainWindow):
         """Save the vehicle information to a file"""
         if not any(self.vehicle_info.values()):
             self.status_message.setText("No vehicle information to save")
-            self.status_message.setStyleSheet(f"color: {self.uv_error};")
+            self.set_status_state("error")
             return
         try:
             # Ask for file location
@@ -1314,41 +1173,28 @@ class BarcodeScanWindow(QMainWindow):
             )
             if not file_path:
                 return
-            # Write to file
-            with open(file_path, 'w') as file:
-                file.write("ULTRAVIOLETTE AUTOMOTIVE - VEHICLE INFORMATION\n")
-                file.write("=" * 50 + "\n")
-                if self.vehicle_info['vin']:
-                    file.write(f"VIN: {self.vehicle_info['vin']}\n")
-                if self.vehicle_info['imei']:
-                    file.write(f"IMEI: {self.vehicle_info['imei']}\n")
-                if self.vehicle_info['uuid']:
-                    file.write(f"UUID: {self.vehicle_info['uuid']}\n")
-                file.write("\n" + "=" * 50 + "\n")
-                file.write(f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            # Build the report, then write it in one go
+            lines = [
+                "ULTRAVIOLETTE AUTOMOTIVE - VEHICLE INFORMATION",
+                "=" * 50,
+                *(f"{key.upper()}: {value}" for key, value in self.vehicle_info.items() if value),
+                "",
+                "=" * 50,
+                f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            ]
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write("\n".join(lines) + "\n")
             # Show success message in results view
-            feedback = QLabel("✓ Information saved successfully!")
-            feedback.setFont(QFont("Montserrat", 11))
-            feedback.setStyleSheet(f"color: {self.uv_secondary};")
-            feedback.setAlignment(Qt.AlignCenter)
-            # Create a temporary widget for the message
-            message_widget = QWidget()
-            message_layout = QVBoxLayout(message_widget)
-            message_layout.addWidget(feedback)
-            # Add to the info cards layout temporarily
-            self.info_cards_layout.addWidget(message_widget, self.info_cards_layout.rowCount(), 0, 1, 2)
-            # Remove after delay
-            QTimer.singleShot(2000, lambda: message_widget.setParent(None))
+            self.show_save_feedback("✓ Information saved successfully!", "success")
         except Exception as e:
-            feedback = QLabel(f"✗ Error saving file: {str(e)}")
-            feedback.setFont(QFont("Montserrat", 11))
-            feedback.setStyleSheet(f"color: {self.uv_error};")
-            feedback.setAlignment(Qt.AlignCenter)
-            message_widget = QWidget()
-            message_layout = QVBoxLayout(message_widget)
-            message_layout.addWidget(feedback)
-            self.info_cards_layout.addWidget(message_widget, self.info_cards_layout.rowCount(), 0, 1, 2)
-            QTimer.singleShot(2000, lambda: message_widget.setParent(None))
+            self.show_save_feedback(f"✗ Error saving file: {str(e)}", "error")
+
+    def show_save_feedback(self, text, state):
+        """Show the save result under the info cards for two seconds"""
+        self.save_feedback_label.setText(text)
+        self.save_feedback_label.setStyleSheet(self._status_qss[state])
+        self.save_feedback_label.show()
+        self._save_feedback_timer.start(2000)
 
     def clear_vehicle_info(self):
         """Clear the displayed vehicle information"""
@@ -1366,28 +1212,21 @@ class BarcodeScanWindow(QMainWindow):
         self.scan_instructions.show()
         # Show confirmation message
         self.status_message.setText("Vehicle information cleared")
-        self.status_message.setStyleSheet(f"color: {self.uv_warning};")
+        self.set_status_state("warning")
         QTimer.singleShot(2000, self.fade_status_message)
 
     def show_help(self):
         """Show help information in a modern dialog"""
+        if self._help_dialog is None:
+            self._help_dialog = self._build_help_dialog()
+        self._help_dialog.exec_()
+
+    def _build_help_dialog(self):
+        """Build the help dialog once, it is reused on later help requests"""
         help_dialog = QDialog(self)
         help_dialog.setWindowTitle("Help")
         help_dialog.setMinimumSize(600, 500)
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 5)
-        help_dialog.setGraphicsEffect(shadow)
-        help_dialog.setStyleSheet(f"""
-            QDialog {{
-                background-color: {self.uv_darker};
-                color: {self.uv_light};
-                border-radius: 12px;
-                border: 1px solid {self.uv_light_gray};
-            }}
-        """)
+        help_dialog.setObjectName("helpDialog")
         help_layout = QVBoxLayout(help_dialog)
         help_layout.setContentsMargins(30, 30, 30, 30)
         help_layout.setSpacing(20)
@@ -1395,38 +1234,20 @@ class BarcodeScanWindow(QMainWindow):
         title_layout = QHBoxLayout()
         title_layout.setAlignment(Qt.AlignLeft)
         help_icon = QLabel()
-        help_icon.setPixmap(QPixmap("assets/help_icon.png").scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        help_icon.setPixmap(_cached_scaled_pixmap("assets/help_icon.png", 24, 24))
         title_layout.addWidget(help_icon)
         title_layout.addSpacing(10)
         title = QLabel("Barcode Scanner Help")
-        title.setFont(QFont("Montserrat", 18, QFont.Bold))
+        title.setFont(_FONT_18_BOLD)
         title_layout.addWidget(title)
         title_layout.addStretch()
         help_layout.addLayout(title_layout)
         # Help content in scroll area
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #2D2D2D;
-                width: 8px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #444444;
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        scroll_area.setObjectName("cardScrollArea")
         content_widget = QWidget()
+        content_widget.setObjectName("scrollContent")
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(5, 5, 15, 5)
         content_layout.setSpacing(20)
@@ -1440,83 +1261,40 @@ class BarcodeScanWindow(QMainWindow):
         for title, content in help_topics:
             topic_card = QFrame()
             topic_card.setObjectName("topicCard")
-            topic_card.setStyleSheet(f"""
-                QFrame#topicCard {{
-                    background: {self.uv_gray};
-                    border-radius: 8px;
-                    border: 1px solid {self.uv_light_gray};
-                }}
-            """)
             topic_layout = QVBoxLayout(topic_card)
             topic_layout.setContentsMargins(15, 15, 15, 15)
             topic_layout.setSpacing(10)
             topic_title = QLabel(title)
-            topic_title.setFont(QFont("Montserrat", 14, QFont.Bold))
-            topic_title.setStyleSheet(f"color: {self.uv_primary};")
+            topic_title.setFont(_FONT_14_BOLD)
+            topic_title.setObjectName("cardTitle")
             topic_layout.addWidget(topic_title)
             topic_content = QLabel(content)
-            topic_content.setFont(QFont("Montserrat", 11))
+            topic_content.setFont(_FONT_11)
             topic_content.setWordWrap(True)
-            topic_content.setStyleSheet(f"color: {self.uv_light};")
+            topic_content.setObjectName("cardText")
             topic_layout.addWidget(topic_content)
             content_layout.addWidget(topic_card)
         scroll_area.setWidget(content_widget)
         help_layout.addWidget(scroll_area)
         # Close button
         close_button = QPushButton("Close")
-        close_button.setFont(QFont("Montserrat", 12, QFont.Bold))
+        close_button.setFont(_FONT_12_BOLD)
         close_button.setCursor(Qt.PointingHandCursor)
         close_button.setFixedSize(120, 40)
-        close_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_primary};
-                color: {self.uv_dark};
-                border: none;
-                border-radius: 20px;
-                padding: 8px 15px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.uv_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.uv_pressed};
-            }}
-        """)
+        close_button.setObjectName("closeButton")
         close_button.clicked.connect(help_dialog.accept)
         help_layout.addWidget(close_button, alignment=Qt.AlignCenter)
-        help_dialog.exec_()
+        return help_dialog
 
     def logout(self):
         """Handle logout action with confirmation dialog"""
-        confirm_dialog = QMessageBox()
+        confirm_dialog = QMessageBox(self)
         confirm_dialog.setWindowTitle("Confirm Logout")
         confirm_dialog.setText("Are you sure you want to log out?")
         confirm_dialog.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         confirm_dialog.setDefaultButton(QMessageBox.No)
-        # Apply custom styling to the message box
-        confirm_dialog.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {self.uv_darker};
-                color: {self.uv_light};
-                border: 1px solid {self.uv_light_gray};
-                border-radius: 8px;
-            }}
-            QMessageBox QLabel {{
-                color: {self.uv_light};
-            }}
-            QMessageBox QPushButton {{
-                background-color: {self.uv_gray};
-                color: {self.uv_light};
-                border: none;
-                border-radius: 4px;
-                padding: 5px 15px;
-                min-width: 80px;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: {self.uv_primary};
-                color: {self.uv_dark};
-            }}
-        """)
+        # Styled by the window stylesheet
+        confirm_dialog.setObjectName("confirmDialog")
         confirm = confirm_dialog.exec_()
         if confirm == QMessageBox.Yes:
             from gui.login_window import LoginWindow
@@ -1529,7 +1307,7 @@ if __name__ == "__main__":
     # Set application-wide style
     app.setStyle("Fusion")
     # Set application font
-    font = QFont("Montserrat", 10)
+    font = _FONT_10
     app.setFont(font)
     # Create and show main window
     window = BarcodeScanWindow()
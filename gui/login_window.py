@@ -1,10 +1,157 @@
 import sys
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QLineEdit, 
-    QPushButton, QMessageBox, QHBoxLayout, QFrame, QSpacerItem, QSizePolicy
-)
-from PyQt5.QtGui import QFont, QPixmap, QResizeEvent, QColor, QPalette, QIcon
-from PyQt5.QtCore import Qt, QSize, pyqtSignal
+import hashlib
+import hmac
+from functools import lru_cache
+from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
+from PyQt5.QtGui import QFont, QPixmap, QColor, QPalette, QIcon
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from gui.login_window_ui import Ui_LoginWindow
+import assets_rc  # Registers the :/assets/ images compiled from assets.qrc
+
+# Ultraviolette brand colors
+UV_BLUE = "#00C3FF"  # Electric blue accent
+UV_DARK = "#121212"  # Dark background
+UV_LIGHT = "#FFFFFF"  # White text
+UV_GRAY = "#333333"  # Secondary dark
+
+# Credential digests, computed once; attempts are hashed and compared in constant time
+_USER_HASH = hashlib.sha256(b"admin").digest()
+_PW_HASH = hashlib.sha256(b"admin123").digest()
+
+# Shared fonts; setFont() copies them, so one instance serves every widget
+_FONT_TITLE = QFont("Montserrat", 24, QFont.Bold)
+_FONT_BODY = QFont("Montserrat", 12)
+_FONT_LABEL = QFont("Montserrat", 10)
+_FONT_INPUT = QFont("Montserrat", 11)
+_FONT_BTN = QFont("Montserrat", 11, QFont.Bold)
+_FONT_FOOTER = QFont("Montserrat", 9)
+
+# Parsed once and shared by every window's palette
+_C_BLUE = QColor(UV_BLUE)
+_C_DARK = QColor(UV_DARK)
+_C_LIGHT = QColor(UV_LIGHT)
+_C_GRAY = QColor(UV_GRAY)
+
+# Login window stylesheet, formatted once at import and shared by every instance
+_LOGIN_QSS = f"""
+    QWidget#uvLoginPanel {{
+        background-color: {UV_DARK};
+        min-width: 400px;
+        max-width: 400px;
+    }}
+    QLabel#uvTitle {{
+        color: {UV_LIGHT};
+    }}
+    QLabel#uvSubtitle {{
+        color: #999999;
+        margin-bottom: 30px;
+    }}
+    QLabel#uvUsernameLabel, QLabel#uvPasswordLabel {{
+        color: {UV_LIGHT};
+    }}
+    QLabel#uvUsernameLabel {{
+        margin-top: 20px;
+    }}
+    QLabel#uvPasswordLabel {{
+        margin-top: 10px;
+    }}
+    QLineEdit#uvUsernameInput, QLineEdit#uvPasswordInput {{
+        background-color: {UV_GRAY};
+        color: {UV_LIGHT};
+        border: 1px solid #444444;
+        border-radius: 6px;
+        padding: 10px 15px;
+    }}
+    QLineEdit#uvUsernameInput {{
+        margin-bottom: 15px;
+    }}
+    QLineEdit#uvPasswordInput {{
+        margin-bottom: 20px;
+    }}
+    QLineEdit#uvUsernameInput:focus, QLineEdit#uvPasswordInput:focus {{
+        border: 2px solid {UV_BLUE};
+    }}
+    QPushButton#uvPrimaryButton {{
+        background-color: {UV_BLUE};
+        color: {UV_DARK};
+        border: none;
+        border-radius: 6px;
+        padding: 12px;
+        font-weight: bold;
+        letter-spacing: 1px;
+        min-height: 24px;  /* 48px with the 12px padding */
+    }}
+    QPushButton#uvPrimaryButton:hover {{
+        background-color: #33D1FF;
+    }}
+    QPushButton#uvPrimaryButton:pressed {{
+        background-color: #0099CC;
+    }}
+    QPushButton#uvLinkButton {{
+        color: {UV_BLUE};
+        border: none;
+        padding: 8px;
+        text-align: center;
+    }}
+    QPushButton#uvLinkButton:hover {{
+        text-decoration: underline;
+    }}
+    QLabel#uvFooter {{
+        color: #666666;
+    }}
+    QMessageBox {{
+        background-color: {UV_DARK};
+        color: {UV_LIGHT};
+    }}
+    QMessageBox QPushButton {{
+        background-color: {UV_BLUE};
+        color: {UV_DARK};
+        min-width: 80px;
+        min-height: 30px;
+        border-radius: 4px;
+    }}
+"""
+
+@lru_cache(maxsize=32)
+def _pixmap(path):
+    """Decode an image asset once and share it between login windows"""
+    return QPixmap(path)
+
+@lru_cache(maxsize=32)
+def _scaled_pixmap(path, w, h):
+    """Smooth-scale an image asset to fit w x h once per size"""
+    return _pixmap(path).scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+def _connect_unique(signal, slot):
+    """Connect signal to slot unless that exact connection already exists"""
+    try:
+        signal.connect(slot, Qt.UniqueConnection)
+    except TypeError:
+        # PyQt raises instead of returning an invalid connection for duplicates
+        pass
+
+@lru_cache(maxsize=None)
+def _dark_palette():
+    """Build the dark theme palette once (needs a QApplication to exist)"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, _C_DARK)
+    palette.setColor(QPalette.WindowText, _C_LIGHT)
+    palette.setColor(QPalette.Base, _C_GRAY)
+    palette.setColor(QPalette.AlternateBase, _C_DARK)
+    palette.setColor(QPalette.ToolTipBase, _C_LIGHT)
+    palette.setColor(QPalette.ToolTipText, _C_DARK)
+    palette.setColor(QPalette.Text, _C_LIGHT)
+    palette.setColor(QPalette.Button, _C_GRAY)
+    palette.setColor(QPalette.ButtonText, _C_LIGHT)
+    palette.setColor(QPalette.Link, _C_BLUE)
+    palette.setColor(QPalette.Highlight, _C_BLUE)
+    palette.setColor(QPalette.HighlightedText, _C_DARK)
+    return palette
+
+@lru_cache(maxsize=32)
+def _icon(path):
+    """Load an icon asset once and share it between login windows"""
+    return QIcon(path)
 
 class LoginWindow(QMainWindow):
     login_successful = pyqtSignal()  # Signal to indicate successful login
@@ -12,253 +159,93 @@ class LoginWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Ultraviolette brand colors
-        self.uv_blue = "#00C3FF"  # Electric blue accent
-        self.uv_dark = "#121212"  # Dark background
-        self.uv_light = "#FFFFFF"  # White text
-        self.uv_gray = "#333333"  # Secondary dark
-
-        self.setWindowTitle("Ultraviolette Dashboard")
-        self.resize(1200, 800)
-        self.setMinimumSize(800, 600)
-        
         # Set application icon
-        self.setWindowIcon(QIcon("assets/small_icon.PNG"))
+        self.setWindowIcon(_icon(":/assets/small_icon.PNG"))
         
         # Set dark theme globally
         self.apply_dark_theme()
+
+        # Background image is decoded after the window first appears
+        self._background_loaded = False
+
+        # Failed-login dialog, built on first use
+        self._error_box = None
+
+        # One stylesheet for every widget (and the error dialog), set before they exist
+        self.setStyleSheet(_LOGIN_QSS)
         
         self.init_ui()
 
     def apply_dark_theme(self):
         """Apply Ultraviolette's dark theme to the entire application"""
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(self.uv_dark))
-        palette.setColor(QPalette.WindowText, QColor(self.uv_light))
-        palette.setColor(QPalette.Base, QColor(self.uv_gray))
-        palette.setColor(QPalette.AlternateBase, QColor(self.uv_dark))
-        palette.setColor(QPalette.ToolTipBase, QColor(self.uv_light))
-        palette.setColor(QPalette.ToolTipText, QColor(self.uv_dark))
-        palette.setColor(QPalette.Text, QColor(self.uv_light))
-        palette.setColor(QPalette.Button, QColor(self.uv_gray))
-        palette.setColor(QPalette.ButtonText, QColor(self.uv_light))
-        palette.setColor(QPalette.Link, QColor(self.uv_blue))
-        palette.setColor(QPalette.Highlight, QColor(self.uv_blue))
-        palette.setColor(QPalette.HighlightedText, QColor(self.uv_dark))
-        
-        self.setPalette(palette)
+        self.setPalette(_dark_palette())
 
     def init_ui(self):
         """Create the login UI with Ultraviolette branding"""
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QHBoxLayout(central_widget)
-        main_layout.setSpacing(0)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Image panel - will expand to fill available space
-        self.image_panel = QLabel()
-        self.image_panel.setAlignment(Qt.AlignCenter)
-        self.image_panel.setScaledContents(False)  # We'll handle scaling ourselves
-        self.bg_pixmap = QPixmap("assets/bg_imnage.png")
-        self.update_background_image()
-        
-        # Login panel - fixed width regardless of window size
-        self.login_panel = QWidget()
-        self.login_panel.setFixedWidth(400)  # Fixed width for login panel
-        self.login_panel.setStyleSheet(f"background-color: {self.uv_dark};")
-        login_layout = QVBoxLayout(self.login_panel)
-        login_layout.setContentsMargins(40, 60, 40, 60)
-        
-        # Add logo at the top - now bigger
-        logo_label = QLabel()
-        logo_pixmap = QPixmap("assets/ultraviolette_automotive_logo.jpg")
-        logo_label.setPixmap(logo_pixmap.scaled(300, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        logo_label.setAlignment(Qt.AlignCenter)  # Center the logo
-        login_layout.addWidget(logo_label)
-        
-        login_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
-        
-        # Welcome text
-        title = QLabel("Welcome Back")
-        title.setFont(QFont("Montserrat", 24, QFont.Bold))
-        title.setStyleSheet(f"color: {self.uv_light};")
-        title.setAlignment(Qt.AlignCenter)  # Center the text
-        login_layout.addWidget(title)
-        
-        subtitle = QLabel("Sign in to access your Ultraviolette dashboard")
-        subtitle.setFont(QFont("Montserrat", 12))
-        subtitle.setStyleSheet(f"color: #999999; margin-bottom: 30px;")
-        subtitle.setAlignment(Qt.AlignCenter)  # Center the text
-        login_layout.addWidget(subtitle)
-        
-        # Form fields
-        # Username
-        username_label = QLabel("Username")
-        username_label.setFont(QFont("Montserrat", 10))
-        username_label.setStyleSheet(f"color: {self.uv_light}; margin-top: 20px;")
-        login_layout.addWidget(username_label)
-        
-        self.username_input = QLineEdit()
-        self.username_input.setPlaceholderText("Enter your username")
-        self.username_input.setFont(QFont("Montserrat", 11))
-        self.username_input.setMinimumHeight(45)
-        self.username_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.uv_gray};
-                color: {self.uv_light};
-                border: 1px solid #444444;
-                border-radius: 6px;
-                padding: 10px 15px;
-                margin-bottom: 15px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {self.uv_blue};
-            }}
-        """)
-        login_layout.addWidget(self.username_input)
-        
-        # Password
-        password_label = QLabel("Password")
-        password_label.setFont(QFont("Montserrat", 10))
-        password_label.setStyleSheet(f"color: {self.uv_light}; margin-top: 10px;")
-        login_layout.addWidget(password_label)
-        
-        self.password_input = QLineEdit()
-        self.password_input.setPlaceholderText("Enter your password")
-        self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setFont(QFont("Montserrat", 11))
-        self.password_input.setMinimumHeight(45)
-        self.password_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.uv_gray};
-                color: {self.uv_light};
-                border: 1px solid #444444;
-                border-radius: 6px;
-                padding: 10px 15px;
-                margin-bottom: 20px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {self.uv_blue};
-            }}
-        """)
-        login_layout.addWidget(self.password_input)
-        
-        # Login Button
-        login_button = QPushButton("SIGN IN")
-        login_button.setFont(QFont("Montserrat", 11, QFont.Bold))
-        login_button.setMinimumHeight(48)
-        login_button.setCursor(Qt.PointingHandCursor)
-        login_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.uv_blue};
-                color: {self.uv_dark};
-                border: none;
-                border-radius: 6px;
-                padding: 12px;
-                font-weight: bold;
-                letter-spacing: 1px;
-            }}
-            QPushButton:hover {{
-                background-color: #33D1FF;
-            }}
-            QPushButton:pressed {{
-                background-color: #0099CC;
-            }}
-        """)
-        login_button.clicked.connect(self.handle_login)
-        login_layout.addWidget(login_button)
-        
-        # Forgot password link
-        forgot_pw = QPushButton("Forgot password?")
-        forgot_pw.setFont(QFont("Montserrat", 10))
-        forgot_pw.setFlat(True)
-        forgot_pw.setCursor(Qt.PointingHandCursor)
-        forgot_pw.setStyleSheet(f"""
-            QPushButton {{
-                color: {self.uv_blue};
-                border: none;
-                padding: 8px;
-                text-align: center;
-            }}
-            QPushButton:hover {{
-                text-decoration: underline;
-            }}
-        """)
-        # Create a layout to center the forgot password button
-        forgot_layout = QHBoxLayout()
-        forgot_layout.addStretch()
-        forgot_layout.addWidget(forgot_pw)
-        forgot_layout.addStretch()
-        login_layout.addLayout(forgot_layout)
-        
-        login_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
-        
-        # Footer text
-        footer = QLabel("© 2025 Ultraviolette Automotive Pvt. Ltd.")
-        footer.setFont(QFont("Montserrat", 9))
-        footer.setStyleSheet("color: #666666;")
-        footer.setAlignment(Qt.AlignCenter)
-        login_layout.addWidget(footer)
-        
-        # Add panels to main layout
-        main_layout.addWidget(self.image_panel, 1)  # Image panel takes all remaining space
-        main_layout.addWidget(self.login_panel, 0)  # Login panel has fixed width
-        
-        # Connect enter key to login
-        self.password_input.returnPressed.connect(login_button.click)
-        self.username_input.returnPressed.connect(self.password_input.setFocus)
+        # Widget tree and layouts come from the precompiled login_window.ui
+        self.ui = Ui_LoginWindow()
+        self.ui.setupUi(self)
+        self.image_panel = self.ui.imagePanel  # Background is loaded by showEvent
+        self.login_panel = self.ui.uvLoginPanel
+        self.username_input = self.ui.uvUsernameInput
+        self.password_input = self.ui.uvPasswordInput
+        login_button = self.ui.uvPrimaryButton
 
-    def update_background_image(self):
-        """Update the background image display based on current window size"""
-        if self.bg_pixmap.isNull():
-            return
-            
-        # Calculate the available width for the image (total width minus login panel width)
-        image_width = self.width() - 400  # Subtract login panel width
-        
-        # Scale image to fit the panel while preserving aspect ratio
-        scaled_pixmap = self.bg_pixmap.scaled(
-            image_width, 
-            self.height(), 
-            Qt.KeepAspectRatio, 
-            Qt.SmoothTransformation
-        )
-        
-        self.image_panel.setPixmap(scaled_pixmap)
+        # Logo at the top
+        self.ui.logoLabel.setPixmap(_scaled_pixmap(":/assets/ultraviolette_automotive_logo.jpg", 300, 100))
+
+        # Fonts
+        self.ui.uvTitle.setFont(_FONT_TITLE)
+        self.ui.uvSubtitle.setFont(_FONT_BODY)
+        self.ui.uvUsernameLabel.setFont(_FONT_LABEL)
+        self.username_input.setFont(_FONT_INPUT)
+        self.ui.uvPasswordLabel.setFont(_FONT_LABEL)
+        self.password_input.setFont(_FONT_INPUT)
+        login_button.setFont(_FONT_BTN)
+        self.ui.uvLinkButton.setFont(_FONT_LABEL)
+        self.ui.uvFooter.setFont(_FONT_FOOTER)
+
+        # Connect login button and enter key (once, even if init_ui runs again)
+        _connect_unique(login_button.clicked, self.handle_login)
+        _connect_unique(self.password_input.returnPressed, login_button.click)
+        _connect_unique(self.username_input.returnPressed, self.password_input.setFocus)
+
+    def showEvent(self, event):
+        """Load the background image once the window is on screen"""
+        super().showEvent(event)
+        if not self._background_loaded:
+            self._background_loaded = True
+            # Let the login form paint first, then decode the large PNG
+            QTimer.singleShot(0, self.load_background)
 
-    def resizeEvent(self, event: QResizeEvent):
-        """Handle window resize events"""
-        super().resizeEvent(event)
-        self.update_background_image()
+    def load_background(self):
+        """Decode the background image and hand it to the image panel"""
+        self.bg_pixmap = _pixmap(":/assets/bg_imnage.png")
+        self.image_panel.setSourcePixmap(self.bg_pixmap)
 
     def handle_login(self):
         """Verify login credentials."""
         username = self.username_input.text()
         password = self.password_input.text()
 
-        if username == "admin" and password == "admin123":
-            self.login_successful.emit()  # Emit the signal on successful login
+        user_ok = hmac.compare_digest(hashlib.sha256(username.encode()).digest(), _USER_HASH)
+        password_ok = hmac.compare_digest(hashlib.sha256(password.encode()).digest(), _PW_HASH)
+        if user_ok and password_ok:
+            # AppManager (main.py) listens for this; windows reopened on logout don't
+            if self.receivers(self.login_successful) > 0:
+                # Hide first so the next window opens without the login form still showing
+                self.hide()
+                self.login_successful.emit()
         else:
-            error_msg = QMessageBox(self)
-            error_msg.setIcon(QMessageBox.Warning)
-            error_msg.setWindowTitle("Authentication Failed")
-            error_msg.setText("Invalid username or password")
-            error_msg.setStandardButtons(QMessageBox.Ok)
-            error_msg.setStyleSheet(f"""
-                QMessageBox {{
-                    background-color: {self.uv_dark};
-                    color: {self.uv_light};
-                }}
-                QPushButton {{
-                    background-color: {self.uv_blue};
-                    color: {self.uv_dark};
-                    min-width: 80px;
-                    min-height: 30px;
-                    border-radius: 4px;
-                }}
-            """)
-            error_msg.exec_()
+            # Built on the first failure and reused afterwards
+            if self._error_box is None:
+                self._error_box = QMessageBox(self)
+                self._error_box.setIcon(QMessageBox.Warning)
+                self._error_box.setWindowTitle("Authentication Failed")
+                self._error_box.setText("Invalid username or password")
+                self._error_box.setStandardButtons(QMessageBox.Ok)
+                # Styled by the window stylesheet
+            self._error_box.exec_()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gui/login_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LoginWindow(object):
+    def setupUi(self, LoginWindow):
+        LoginWindow.setObjectName("LoginWindow")
+        LoginWindow.resize(1200, 800)
+        LoginWindow.setMinimumSize(QtCore.QSize(800, 600))
+        self.centralWidget = QtWidgets.QWidget(LoginWindow)
+        self.centralWidget.setObjectName("centralWidget")
+        self.mainLayout = QtWidgets.QHBoxLayout(self.centralWidget)
+        self.mainLayout.setContentsMargins(0, 0, 0, 0)
+        self.mainLayout.setSpacing(0)
+        self.mainLayout.setObjectName("mainLayout")
+        self.imagePanel = AspectPixmapLabel(self.centralWidget)
+        self.imagePanel.setObjectName("imagePanel")
+        self.mainLayout.addWidget(self.imagePanel)
+        self.uvLoginPanel = QtWidgets.QWidget(self.centralWidget)
+        self.uvLoginPanel.setObjectName("uvLoginPanel")
+        self.loginLayout = QtWidgets.QVBoxLayout(self.uvLoginPanel)
+        self.loginLayout.setContentsMargins(40, 60, 40, 60)
+        self.loginLayout.setObjectName("loginLayout")
+        self.logoLabel = QtWidgets.QLabel(self.uvLoginPanel)
+        self.logoLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.logoLabel.setObjectName("logoLabel")
+        self.loginLayout.addWidget(self.logoLabel)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.loginLayout.addItem(spacerItem)
+        self.uvTitle = QtWidgets.QLabel(self.uvLoginPanel)
+        self.uvTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.uvTitle.setObjectName("uvTitle")
+        self.loginLayout.addWidget(self.uvTitle)
+        self.uvSubtitle = QtWidgets.QLabel(self.uvLoginPanel)
+        self.uvSubtitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.uvSubtitle.setObjectName("uvSubtitle")
+        self.loginLayout.addWidget(self.uvSubtitle)
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.formLayout.setRowWrapPolicy(QtWidgets.QFormLayout.WrapAllRows)
+        self.formLayout.setLabelAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.formLayout.setFormAlignment(QtCore.Qt.AlignTop)
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.formLayout.setObjectName("formLayout")
+        self.uvUsernameLabel = QtWidgets.QLabel(self.uvLoginPanel)
+        self.uvUsernameLabel.setObjectName("uvUsernameLabel")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.uvUsernameLabel)
+        self.uvUsernameInput = QtWidgets.QLineEdit(self.uvLoginPanel)
+        self.uvUsernameInput.setObjectName("uvUsernameInput")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.uvUsernameInput)
+        self.uvPasswordLabel = QtWidgets.QLabel(self.uvLoginPanel)
+        self.uvPasswordLabel.setObjectName("uvPasswordLabel")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.uvPasswordLabel)
+        self.uvPasswordInput = QtWidgets.QLineEdit(self.uvLoginPanel)
+        self.uvPasswordInput.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.uvPasswordInput.setObjectName("uvPasswordInput")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.uvPasswordInput)
+        self.loginLayout.addLayout(self.formLayout)
+        self.uvPrimaryButton = QtWidgets.QPushButton(self.uvLoginPanel)
+        self.uvPrimaryButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.uvPrimaryButton.setObjectName("uvPrimaryButton")
+        self.loginLayout.addWidget(self.uvPrimaryButton)
+        self.forgotLayout = QtWidgets.QHBoxLayout()
+        self.forgotLayout.setObjectName("forgotLayout")
+        spacerItem1 = QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.forgotLayout.addItem(spacerItem1)
+        self.uvLinkButton = QtWidgets.QPushButton(self.uvLoginPanel)
+        self.uvLinkButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.uvLinkButton.setFlat(True)
+        self.uvLinkButton.setObjectName("uvLinkButton")
+        self.forgotLayout.addWidget(self.uvLinkButton)
+        spacerItem2 = QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.forgotLayout.addItem(spacerItem2)
+        self.loginLayout.addLayout(self.forgotLayout)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.loginLayout.addItem(spacerItem3)
+        self.uvFooter = QtWidgets.QLabel(self.uvLoginPanel)
+        self.uvFooter.setAlignment(QtCore.Qt.AlignCenter)
+        self.uvFooter.setObjectName("uvFooter")
+        self.loginLayout.addWidget(self.uvFooter)
+        self.mainLayout.addWidget(self.uvLoginPanel)
+        self.mainLayout.setStretch(0, 1)
+        LoginWindow.setCentralWidget(self.centralWidget)
+
+        self.retranslateUi(LoginWindow)
+        QtCore.QMetaObject.connectSlotsByName(LoginWindow)
+
+    def retranslateUi(self, LoginWindow):
+        _translate = QtCore.QCoreApplication.translate
+        LoginWindow.setWindowTitle(_translate("LoginWindow", "Ultraviolette Dashboard"))
+        self.uvTitle.setText(_translate("LoginWindow", "Welcome Back"))
+        self.uvSubtitle.setText(_translate("LoginWindow", "Sign in to access your Ultraviolette dashboard"))
+        self.uvUsernameLabel.setText(_translate("LoginWindow", "Username"))
+        self.uvUsernameInput.setPlaceholderText(_translate("LoginWindow", "Enter your username"))
+        self.uvPasswordLabel.setText(_translate("LoginWindow", "Password"))
+        self.uvPasswordInput.setPlaceholderText(_translate("LoginWindow", "Enter your password"))
+        self.uvPrimaryButton.setText(_translate("LoginWindow", "SIGN IN"))
+        self.uvLinkButton.setText(_translate("LoginWindow", "Forgot password?"))
+        self.uvFooter.setText(_translate("LoginWindow", "© 2025 Ultraviolette Automotive Pvt. Ltd."))
+from gui.pixmap_label import AspectPixmapLabel
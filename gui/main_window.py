@@ -1,12 +1,14 @@
 import os
 import sys
 import io
+import hashlib
 import logging
-import pandas as pd
-import numpy as np
-from dotenv import load_dotenv
-import ssl
-import certifi
+import shelve
+import time
+from datetime import date
+from functools import lru_cache
+from html import escape
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
@@ -17,26 +19,16 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QPixmap
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
 
-import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-
-# Import analysis functions
-from analysis.run_analysis import (
-    temp_fluctuation_detection,
-    solder_issue_detection,
-    weld_issue_detection,
-    normalize_column_names,
-    validate_columns
-)
-
 # Import AWSClient class
 from custom_aws_client import AWSClient
+# The scan and login windows only import MainWindow lazily, so there is no cycle
+from gui.barcode_scan_window import BarcodeScanWindow
+from gui.login_window import LoginWindow
 
-# Load environment variables from .env file
-load_dotenv()  # Load the environment variables
+# Load environment variables from .env file, unless the environment already has the credentials
+if not (os.getenv("AWS_ACCESS_KEY_ID") and os.getenv("AWS_SECRET_ACCESS_KEY")):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Configure logging
 logging.basicConfig(
@@ -48,10 +40,235 @@ logging.basicConfig(
     ]
 )
 
-class AnalysisThread(QThread):
+# Shared fonts; setFont() copies them, so one instance serves every widget
+_FONT_9 = QFont("Montserrat", 9)
+_FONT_9_BOLD = QFont("Montserrat", 9, QFont.Bold)
+_FONT_10 = QFont("Montserrat", 10)
+_FONT_11 = QFont("Montserrat", 11)
+_FONT_12_BOLD = QFont("Montserrat", 12, QFont.Bold)
+_FONT_14 = QFont("Montserrat", 14)
+_FONT_14_BOLD = QFont("Montserrat", 14, QFont.Bold)
+_FONT_16_BOLD = QFont("Montserrat", 16, QFont.Bold)
+_FONT_18_BOLD = QFont("Montserrat", 18, QFont.Bold)
+_FONT_20 = QFont("Montserrat", 20)
+
+# Result graphs draw at most this many points once a log exceeds PLOT_DECIMATE_ABOVE rows
+PLOT_MAX_POINTS = 2000
+PLOT_DECIMATE_ABOVE = 4000
+
+# Sidebar bike detail rows: (label, bike_details key, fallback value)
+_BIKE_DETAIL_FIELDS = (
+    ("VIN:", "vin", "N/A"),
+    ("IMEI:", "imei", "N/A"),
+    ("Model:", "model", "F77"),
+    ("Year:", "year", "2023"),
+    ("Color:", "color", "N/A"),
+)
+
+@lru_cache(maxsize=1)
+def _dark_palette():
+    """Build the dark theme palette once (needs a QApplication to exist)"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(18, 18, 18))
+    palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
+    palette.setColor(QPalette.Base, QColor(51, 51, 51))
+    palette.setColor(QPalette.AlternateBase, QColor(18, 18, 18))
+    palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
+    palette.setColor(QPalette.ToolTipText, QColor(18, 18, 18))
+    palette.setColor(QPalette.Text, QColor(255, 255, 255))
+    palette.setColor(QPalette.Button, QColor(51, 51, 51))
+    palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
+    palette.setColor(QPalette.Link, QColor(0, 195, 255))
+    palette.setColor(QPalette.Highlight, QColor(0, 195, 255))
+    palette.setColor(QPalette.HighlightedText, QColor(18, 18, 18))
+    return palette
+
+# On-disk cache of S3 listings, keyed by IMEI and day
+LISTING_CACHE = os.path.join(os.path.expanduser("~"), ".bike_os", "listings")
+LISTING_TTL = 5 * 60
+
+def _listing_key(imei):
+    return f"{imei}:{date.today().isoformat()}"
+
+# Listings read from or written to the shelf this session, so it is opened once per IMEI
+_listing_memo = {}
+
+def load_cached_listing(imei):
+    """Return (age_seconds, log_objects) from the listing cache, or None"""
+    key = _listing_key(imei)
+    if key not in _listing_memo:
+        try:
+            with shelve.open(LISTING_CACHE, flag='r') as cache:
+                _listing_memo[key] = cache[key]
+        except Exception:
+            return None
+    stamp, log_objects = _listing_memo[key]
+    return time.time() - stamp, log_objects
+
+def store_cached_listing(imei, log_objects):
+    """Save a fresh listing to the cache"""
+    _listing_memo[_listing_key(imei)] = (time.time(), log_objects)
+    try:
+        os.makedirs(os.path.dirname(LISTING_CACHE), exist_ok=True)
+        with shelve.open(LISTING_CACHE) as cache:
+            cache[_listing_key(imei)] = (time.time(), log_objects)
+    except Exception as e:
+        logging.warning(f"Could not cache log listing: {str(e)}")
+
+# On-disk cache of decoded logs (analysis columns only), keyed by S3 key, version and schema
+LOG_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".bike_os", "logs")
+LOG_CACHE_MAX_FILES = 50
+
+# Log list item role holding the object's version (last modified time and size)
+LOG_VERSION_ROLE = Qt.UserRole + 1
+
+def log_version(last_modified, size):
+    """Version string for a listed S3 object; it changes whenever the log is re-uploaded"""
+    return f"{last_modified.isoformat()}/{size}"
+
+@lru_cache(maxsize=1)
+def _log_cache_schema():
+    """Tag for the decoded columns and dtypes, so changing either misses old entries"""
+    from analysis.run_analysis import ANALYSIS_COLUMNS, TELEMETRY_DTYPES
+    return f"{sorted(ANALYSIS_COLUMNS)}{sorted(TELEMETRY_DTYPES.items())}"
+
+def _log_cache_path(log_key, version=None):
+    cache_key = log_key if version is None else f"{log_key}@{version}"
+    cache_key += "#" + _log_cache_schema()
+    return os.path.join(LOG_CACHE_DIR, hashlib.sha1(cache_key.encode()).hexdigest() + ".parquet")
+
+def load_cached_log(log_key, version=None):
+    """Return the decoded DataFrame for this version of a log from the cache, or None"""
+    path = _log_cache_path(log_key, version)
+    if not os.path.exists(path):
+        return None
+    try:
+        import pandas as pd
+        df = pd.read_parquet(path)
+        # Mark the entry as recently used; eviction drops the oldest mtimes
+        os.utime(path)
+        return df
+    except Exception as e:
+        logging.warning(f"Could not read cached log {log_key}: {str(e)}")
+        return None
+
+def store_cached_log(log_key, df, version=None):
+    """Save a decoded log to the cache, dropping the least recently used entries past the limit"""
+    try:
+        os.makedirs(LOG_CACHE_DIR, exist_ok=True)
+        path = _log_cache_path(log_key, version)
+        df.to_parquet(path + ".tmp", compression="zstd", engine="pyarrow")
+        os.replace(path + ".tmp", path)
+        entries = sorted(
+            (entry for entry in os.scandir(LOG_CACHE_DIR) if entry.name.endswith(".parquet")),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        for entry in entries[:-LOG_CACHE_MAX_FILES]:
+            os.remove(entry.path)
+    except Exception as e:
+        logging.warning(f"Could not cache log {log_key}: {str(e)}")
+
+def thin_channels(x, values):
+    """Per-column x and y arrays for plotting, thinned past PLOT_DECIMATE_ABOVE rows
+
+    Each channel keeps its own minimum and maximum per bucket, so a spike or
+    dropout on any channel is still drawn.
+    """
+    import numpy as np
+    if len(x) > PLOT_DECIMATE_ABOVE:
+        from analysis.downsample import minmax_envelope
+        keep = minmax_envelope(values, PLOT_MAX_POINTS)
+        return x[keep], np.take_along_axis(values, keep, axis=0)
+    return np.broadcast_to(x[:, None], values.shape), values
+
+def load_matplotlib():
+    """Import matplotlib on first use; it is only needed once results are drawn"""
+    import matplotlib
+    matplotlib.use('Qt5Agg')
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+    return Figure, FigureCanvas, NavigationToolbar
+
+# Minimum gap between cross-thread progress signals, in seconds
+PROGRESS_INTERVAL = 0.03
+
+# Logs downloaded at once by the 20km ride filter; large ones split into ranges on top
+FILTER_WORKERS = 4
+
+class ProgressThread(QThread):
+    """Base for worker threads that report throttled progress to the UI"""
+    progress = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._last_emit = 0.0
+
+    def _emit(self, value, message):
+        """Emit progress, dropping updates that follow the last one too closely"""
+        now = time.monotonic()
+        if value >= 100 or now - self._last_emit >= PROGRESS_INTERVAL:
+            self._last_emit = now
+            self.progress.emit(value, message)
+
+class LoadLogThread(ProgressThread):
+    """Thread for downloading and decoding a log file without blocking the UI"""
+    loaded = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, aws_client, log_key, version=None, parent=None):
+        super().__init__(parent)
+        self.aws_client = aws_client
+        self.log_key = log_key
+        self.version = version
+
+    def _download_progress(self, done, total):
+        self._emit(int(done * 100 / total) if total else 100,
+                   f"Downloading log file... {done // 1024} / {total // 1024} KB")
+
+    def run(self):
+        try:
+            from analysis.run_analysis import (
+                normalize_column_names,
+                downcast_telemetry,
+                REQUIRED_COLUMNS,
+                ANALYSIS_COLUMNS,
+                TELEMETRY_DTYPES
+            )
+
+            # Logs analysed before are read back already decoded and normalized
+            df = load_cached_log(self.log_key, self.version)
+            if df is None:
+                # Download, decompress and decode only the columns the detectors and graphs use
+                df = self.aws_client.stream_log_file(
+                    self.log_key,
+                    columns=ANALYSIS_COLUMNS,
+                    progress_callback=self._download_progress,
+                    dtypes=TELEMETRY_DTYPES
+                )
+
+                # Normalize and shrink the display-only channels
+                df = downcast_telemetry(normalize_column_names(df))
+                store_cached_log(self.log_key, df, self.version)
+            print(f"\n[COLUMNS FOUND] {df.columns.tolist()}")
+
+            # Verify critical columns exist
+            available = set(df.columns)
+            for analysis_type, cols in REQUIRED_COLUMNS.items():
+                missing = cols - available
+                if missing:
+                    print(f"[WARNING] Missing {analysis_type} columns: {sorted(missing)}")
+
+            self.loaded.emit(df)
+
+        except Exception as e:
+            error_msg = f"File Processing Error: {str(e)}"
+            print(f"[FILE ERROR] {error_msg}")
+            self.error.emit(error_msg)
+
+class AnalysisThread(ProgressThread):
     """Thread for running analysis in background with enhanced logging"""
     finished = pyqtSignal(dict, dict, dict)
-    progress = pyqtSignal(int, str)
     error = pyqtSignal(str)
 
     def __init__(self, df):
@@ -60,26 +277,35 @@ class AnalysisThread(QThread):
 
     def run(self):
         try:
+            # Import analysis functions (pulls in pandas on first run)
+            from analysis.run_analysis import run_detectors
+
             # Data validation
             if self.df is None or self.df.empty:
                 raise ValueError("Empty DataFrame provided for analysis")
                 
-            print("\n[ANALYSIS] Starting temperature analysis...")
-            self.progress.emit(20, "Analyzing temperature fluctuations...")
-            temp_results = temp_fluctuation_detection(self.df)
-            print(f"[TEMP RESULTS] {temp_results}")
-            
-            print("\n[ANALYSIS] Starting solder analysis...")
-            self.progress.emit(50, "Checking for solder issues...")
-            solder_results = solder_issue_detection(self.df)
-            print(f"[SOLDER RESULTS] {solder_results}")
-            
-            print("\n[ANALYSIS] Starting weld analysis...")
-            self.progress.emit(80, "Checking for weld issues...")
-            weld_results = weld_issue_detection(self.df)
-            print(f"[WELD RESULTS] {weld_results}")
+            # The detectors run in parallel, each on its own copy of the columns it reads
+            print("\n[ANALYSIS] Starting temperature, solder and weld analysis...")
+            self._emit(10, "Running analyses...")
+            labels = {
+                "temp": "Temperature analysis done",
+                "solder": "Solder check done",
+                "weld": "Weld check done",
+            }
+            done = []
+
+            def report(name, result):
+                done.append(name)
+                print(f"[{name.upper()} RESULTS] {result}")
+                if len(done) < len(labels):
+                    self._emit(len(done) * 100 // len(labels), labels[name] + "...")
+
+            results = run_detectors(self.df, report)
+            temp_results = results["temp"]
+            solder_results = results["solder"]
+            weld_results = results["weld"]
             
-            self.progress.emit(100, "Analysis complete!")
+            self._emit(100, "Analysis complete!")
             self.finished.emit(solder_results, weld_results, temp_results)
             
         except Exception as e:
@@ -88,9 +314,83 @@ class AnalysisThread(QThread):
             logging.error(error_msg, exc_info=True)
             self.error.emit(error_msg)
 
+class ListLogsThread(QThread):
+    """Thread for listing S3 log files without blocking the UI"""
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, aws_client, imei):
+        super().__init__()
+        self.aws_client = aws_client
+        self.imei = imei
+
+    def run(self):
+        try:
+            log_objects = self.aws_client.get_available_log_objects(self.imei)
+            store_cached_listing(self.imei, log_objects)
+            self.finished.emit(log_objects)
+        except Exception as e:
+            logging.error(f"Error fetching log files from AWS: {str(e)}", exc_info=True)
+            self.error.emit("Failed to fetch log files from AWS.")
+
+class PlotThread(QThread):
+    """Thread for building result graph figures without blocking the UI"""
+    figure_ready = pyqtSignal(object, object, object)
+    error = pyqtSignal(str)
+
+    def __init__(self, builders, parent=None):
+        super().__init__(parent)
+        self.builders = builders
+
+    def run(self):
+        # Only the Figure is built here; its Qt canvas is created on the UI thread
+        for key, build in self.builders:
+            try:
+                fig, click_args = build()
+            except Exception as e:
+                logging.error(f"Error building {key[0]} graph: {str(e)}", exc_info=True)
+                self.error.emit("Failed to build analysis graphs.")
+                continue
+            self.figure_ready.emit(key, fig, click_args)
+
+class ReportThread(QThread):
+    """Thread for writing the result graphs to a PDF report"""
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, builders, file_path):
+        super().__init__()
+        self.builders = builders
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            from matplotlib.backends.backend_pdf import PdfPages
+            with PdfPages(self.file_path) as pdf:
+                for _, build in self.builders:
+                    fig, _ = build()
+                    pdf.savefig(fig)
+            self.finished.emit(self.file_path)
+        except Exception as e:
+            logging.error(f"Error saving report: {str(e)}", exc_info=True)
+            self.error.emit(f"Failed to save report: {str(e)}")
+
+class GraphView(QWidget):
+    """Figure, canvas and toolbar for enlarged graphs, reused across dialogs"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        Figure, FigureCanvas, NavigationToolbar = load_matplotlib()
+        self.figure = Figure(figsize=(10, 6), dpi=100)
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+
 class GraphDialog(QDialog):
     """Dialog to display enlarged graphs"""
-    def __init__(self, title, x_label, y_label, x_data, y_data, parent=None):
+    def __init__(self, title, x_label, y_label, x_data, y_data, parent=None, view=None):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setWindowFlags(self.windowFlags() | 
@@ -98,27 +398,62 @@ class GraphDialog(QDialog):
                           Qt.WindowMinimizeButtonHint)
         self.resize(800, 600)
         layout = QVBoxLayout(self)
-        self.figure = Figure(figsize=(10, 6), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
-        self.toolbar = NavigationToolbar(self.canvas, self)
-        layout.addWidget(self.toolbar)
-        layout.addWidget(self.canvas)
+        self.view = view or GraphView()
+        self.figure = self.view.figure
+        self.canvas = self.view.canvas
+        self.toolbar = self.view.toolbar
+        layout.addWidget(self.view)
         self.plot_data(title, x_label, y_label, x_data, y_data)
 
     def plot_data(self, title, x_label, y_label, x_data, y_data):
-        ax = self.figure.add_subplot(111)
+        import numpy as np
+        ax = self.figure.axes[0] if self.figure.axes else self.figure.add_subplot(111)
         ax.clear()
         if isinstance(y_data, dict):
-            for label, data in y_data.items():
-                ax.plot(x_data, data, label=label)
+            labels = list(y_data)
+            values = np.column_stack(list(y_data.values()))
         else:
-            ax.plot(x_data, y_data, label=y_label)
+            values = np.asarray(y_data)
+            values = values.reshape(len(values), -1)
+            labels = [y_label] * values.shape[1]
+        # Keep the full series; only the visible x range is drawn, thinned per channel
+        self._x = np.asarray(x_data)
+        self._values = values
+        self._x_sorted = bool(np.all(np.diff(self._x) >= 0))
+        x, values = self.visible_points(-np.inf, np.inf)
+        lines = ax.plot(x, values, rasterized=True)
+        for line, label in zip(lines, labels):
+            line.set_label(label)
+        ax.callbacks.connect('xlim_changed', self.resample)
         ax.set_title(title, fontsize=12)
         ax.set_xlabel(x_label, fontsize=8)
         ax.set_ylabel(y_label, fontsize=8)
         ax.legend()
         ax.grid(True)
-        self.canvas.draw()
+        # Drop the zoom/pan history left over from the previous graph
+        self.toolbar.update()
+        self.canvas.draw_idle()
+
+    def visible_points(self, lo, hi):
+        """Per-column x and y of the full series between lo and hi, thinned past PLOT_DECIMATE_ABOVE"""
+        import numpy as np
+        x, values = self._x, self._values
+        if self._x_sorted:
+            start = max(int(np.searchsorted(x, lo)) - 1, 0)
+            stop = int(np.searchsorted(x, hi, side='right')) + 1
+            x, values = x[start:stop], values[start:stop]
+        return thin_channels(x, values)
+
+    def resample(self, ax):
+        """Redraw the lines from the full series for the new x range, e.g. after a zoom"""
+        x, values = self.visible_points(*ax.get_xlim())
+        for line, column_x, column_values in zip(ax.lines, x.T, values.T):
+            line.set_data(column_x, column_values)
+
+    def done(self, result):
+        # Detach the shared view so it outlives this dialog
+        self.view.setParent(None)
+        super().done(result)
 
 class MainWindow(QMainWindow):
     def __init__(self, scanned_data=None):
@@ -138,7 +473,26 @@ class MainWindow(QMainWindow):
         self.access_key = os.getenv("AWS_ACCESS_KEY_ID")
         self.secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
         self.bucket_name = os.getenv("BUCKET_NAME", "datalogs-processed-timeseries")
-        self.aws_client = AWSClient(self.access_key, self.secret_key, self.bucket_name)
+        self.aws_client = AWSClient(self.access_key, self.secret_key, self.bucket_name,
+                                    os.getenv("LOG_FALLBACK_PREFIX"))
+        self.list_logs_thread = None
+        self._shown_log_objects = None
+        self._graph_view = None
+        # Result graph canvases for the log (key and version) in self.df, keyed by detector and highlights
+        self._plot_cache = {}
+        self._plot_cache_log = None
+        # One canvas per graph kept from the previous log, redrawn for the next one
+        self._idle_canvases = {}
+        self.load_thread = None
+        self._analysis_in_flight = False
+        self.plot_thread = None
+        self._graph_placeholders = {}
+        # (cache key, figure builder) of the graphs on the results page, in display order
+        self._graph_builders = []
+        self.report_thread = None
+
+        # Static widget styles, applied once for the whole window
+        self.load_stylesheet()
 
         # Initialize UI
         self.init_ui()
@@ -158,7 +512,7 @@ class MainWindow(QMainWindow):
         # Header with logo and bike info
         header = QWidget()
         header.setFixedHeight(70)
-        header.setStyleSheet("background-color: #121212; border-bottom: 1px solid #444;")
+        header.setObjectName("header")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(20, 10, 20, 10)
 
@@ -175,25 +529,13 @@ class MainWindow(QMainWindow):
         logo_label.setPixmap(logo_pixmap.scaled(150, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
         self.bike_info_label = QLabel()
-        self.bike_info_label.setFont(QFont("Montserrat", 10))
-        self.bike_info_label.setStyleSheet("color: #FFFFFF;")
+        self.bike_info_label.setFont(_FONT_10)
+        self.bike_info_label.setObjectName("bodyText")
 
         logout_button = QPushButton("Logout")
-        logout_button.setFont(QFont("Montserrat", 10))
+        logout_button.setFont(_FONT_10)
         logout_button.setCursor(Qt.PointingHandCursor)
-        logout_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #FFFFFF;
-                border: 1px solid #00C3FF;
-                border-radius: 4px;
-                padding: 8px 15px;
-            }
-            QPushButton:hover {
-                background-color: #00C3FF;
-                color: #121212;
-            }
-        """)
+        logout_button.setObjectName("logoutButton")
         logout_button.clicked.connect(self.logout)
 
         header_layout.addWidget(logo_label)
@@ -210,29 +552,40 @@ class MainWindow(QMainWindow):
         sidebar = QWidget()
         sidebar.setMinimumWidth(250)
         sidebar.setMaximumWidth(300)
-        sidebar.setStyleSheet("background-color: #333333;")
+        sidebar.setObjectName("sidebar")
         sidebar_layout = QVBoxLayout(sidebar)
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
         sidebar_layout.setSpacing(0)
 
         # Bike details at top of sidebar
         bike_details_widget = QWidget()
-        bike_details_widget.setStyleSheet("background-color: #333333; padding: 15px;")
+        bike_details_widget.setObjectName("bikeDetails")
         bike_details_layout = QVBoxLayout(bike_details_widget)
         title_label = QLabel("Bike Details")
-        title_label.setFont(QFont("Montserrat", 12, QFont.Bold))
-        title_label.setStyleSheet("color: #00C3FF;")
+        title_label.setFont(_FONT_12_BOLD)
+        title_label.setObjectName("accentTitle")
         bike_details_layout.addWidget(title_label)
         self.details_grid = QGridLayout()
         self.details_grid.setHorizontalSpacing(10)
         self.details_grid.setVerticalSpacing(8)
+        self._detail_value_labels = {}
+        for row, (label, key, _) in enumerate(_BIKE_DETAIL_FIELDS):
+            label_widget = QLabel(label)
+            label_widget.setFont(_FONT_9_BOLD)
+            label_widget.setObjectName("detailLabel")
+            value_widget = QLabel()
+            value_widget.setFont(_FONT_9)
+            value_widget.setObjectName("detailLabel")
+            self.details_grid.addWidget(label_widget, row, 0)
+            self.details_grid.addWidget(value_widget, row, 1)
+            self._detail_value_labels[key] = value_widget
         bike_details_layout.addLayout(self.details_grid)
         sidebar_layout.addWidget(bike_details_widget)
 
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("background-color: #444;")
+        separator.setObjectName("sidebarSeparator")
         sidebar_layout.addWidget(separator)
 
         # Navigation buttons
@@ -245,27 +598,15 @@ class MainWindow(QMainWindow):
         sidebar_layout.addStretch()
 
         back_button = QPushButton("Back to Scanning")
-        back_button.setFont(QFont("Montserrat", 10))
+        back_button.setFont(_FONT_10)
         back_button.setCursor(Qt.PointingHandCursor)
-        back_button.setStyleSheet("""
-            QPushButton {
-                background-color: #00C3FF;
-                color: #121212;
-                border: none;
-                border-radius: 4px;
-                padding: 12px;
-                margin: 15px;
-            }
-            QPushButton:hover {
-                background-color: #33D1FF;
-            }
-        """)
+        back_button.setObjectName("backButton")
         back_button.clicked.connect(self.back_to_scanning)
         sidebar_layout.addWidget(back_button)
 
         # Main content area with stacked widget for different sections
         main_content = QWidget()
-        main_content.setStyleSheet("background-color: #121212;")
+        main_content.setObjectName("mainContent")
         content_layout = QVBoxLayout(main_content)
         self.stacked_widget = QStackedWidget()
 
@@ -277,18 +618,18 @@ class MainWindow(QMainWindow):
         shop_floor_page = QWidget()
         shop_floor_layout = QVBoxLayout(shop_floor_page)
         shop_floor_label = QLabel("Shop Floor - Coming Soon")
-        shop_floor_label.setFont(QFont("Montserrat", 20))
+        shop_floor_label.setFont(_FONT_20)
         shop_floor_label.setAlignment(Qt.AlignCenter)
-        shop_floor_label.setStyleSheet("color: #FFFFFF;")
+        shop_floor_label.setObjectName("bodyText")
         shop_floor_layout.addWidget(shop_floor_label)
 
         # Service Team Page (dummy)
         service_team_page = QWidget()
         service_layout = QVBoxLayout(service_team_page)
         service_label = QLabel("Service Team - Coming Soon")
-        service_label.setFont(QFont("Montserrat", 20))
+        service_label.setFont(_FONT_20)
         service_label.setAlignment(Qt.AlignCenter)
-        service_label.setStyleSheet("color: #FFFFFF;")
+        service_label.setObjectName("bodyText")
         service_layout.addWidget(service_label)
 
         self.stacked_widget.addWidget(self.run_analysis_page)
@@ -304,22 +645,17 @@ class MainWindow(QMainWindow):
         content.setStretchFactor(1, 1)
         main_layout.addWidget(content)
 
+    def load_stylesheet(self):
+        """Load the window stylesheet shared by all static widgets"""
+        try:
+            with open("assets/main_window.qss", encoding="utf-8") as qss_file:
+                self.setStyleSheet(qss_file.read())
+        except OSError as e:
+            print(f"Stylesheet loading error: {str(e)}")
+
     def apply_dark_theme(self):
         """Apply dark theme to the main window"""
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(18, 18, 18))
-        palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Base, QColor(51, 51, 51))
-        palette.setColor(QPalette.AlternateBase, QColor(18, 18, 18))
-        palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
-        palette.setColor(QPalette.ToolTipText, QColor(18, 18, 18))
-        palette.setColor(QPalette.Text, QColor(255, 255, 255))
-        palette.setColor(QPalette.Button, QColor(51, 51, 51))
-        palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Link, QColor(0, 195, 255))
-        palette.setColor(QPalette.Highlight, QColor(0, 195, 255))
-        palette.setColor(QPalette.HighlightedText, QColor(18, 18, 18))
-        self.setPalette(palette)
+        self.setPalette(_dark_palette())
 
     def load_bike_details(self):
         """Load bike details from Excel file by matching VIN/IMEI"""
@@ -346,74 +682,29 @@ class MainWindow(QMainWindow):
 
     def update_bike_details_sidebar(self):
         """Update the bike details in the sidebar"""
-        for i in reversed(range(self.details_grid.count())):
-            widget = self.details_grid.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        row = 0
-        for label, value in [
-            ("VIN:", self.bike_vin),
-            ("IMEI:", self.bike_imei),
-            ("Model:", self.bike_details.get('model', 'F77')),
-            ("Year:", self.bike_details.get('year', '2023')),
-            ("Color:", self.bike_details.get('color', 'N/A'))
-        ]:
-            label_widget = QLabel(label)
-            label_widget.setFont(QFont("Montserrat", 9, QFont.Bold))
-            label_widget.setStyleSheet(f"color: {self.uv_light};")
-            value_widget = QLabel(str(value))
-            value_widget.setFont(QFont("Montserrat", 9))
-            value_widget.setStyleSheet(f"color: {self.uv_light};")
-            self.details_grid.addWidget(label_widget, row, 0)
-            self.details_grid.addWidget(value_widget, row, 1)
-            row += 1
+        details = self.bike_details
+        # VIN and IMEI come straight from the scan, the rest from the details lookup
+        scanned = {"vin": self.bike_vin, "imei": self.bike_imei}
+        for _, key, default in _BIKE_DETAIL_FIELDS:
+            value = scanned[key] if key in scanned else details.get(key, default)
+            self._detail_value_labels[key].setText(str(value))
 
     def create_sidebar_button(self, text, is_active=False):
         """Create a styled sidebar button"""
         button = QPushButton(text)
-        button.setFont(QFont("Montserrat", 11))
+        button.setFont(_FONT_11)
         button.setCursor(Qt.PointingHandCursor)
         button.setCheckable(True)
         button.setChecked(is_active)
         button.setFlat(True)
-        self.update_sidebar_button_style(button)
+        button.setObjectName("sidebarButton")
         button.clicked.connect(lambda: self.update_sidebar_buttons(button))
         return button
 
     def update_sidebar_buttons(self, active_button):
-        """Update the styles of all sidebar buttons"""
+        """Check the active sidebar button; the stylesheet styles the checked state"""
         for button in [self.run_analysis_btn, self.shop_floor_btn, self.service_team_btn]:
             button.setChecked(button == active_button)
-            self.update_sidebar_button_style(button)
-
-    def update_sidebar_button_style(self, button):
-        """Update the style of a sidebar button based on its state"""
-        if button.isChecked():
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #00C3FF;
-                    color: #121212;
-                    border: none;
-                    text-align: left;
-                    padding: 15px 20px;
-                }
-                QPushButton:hover {
-                    background-color: #33D1FF;
-                }
-            """)
-        else:
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #FFFFFF;
-                    border: none;
-                    text-align: left;
-                    padding: 15px 20px;
-                }
-                QPushButton:hover {
-                    background-color: #444444;
-                }
-            """)
 
     def switch_page(self, index):
         """Switch to a different page in the stacked widget"""
@@ -424,8 +715,8 @@ class MainWindow(QMainWindow):
         run_analysis_layout = QVBoxLayout(self.run_analysis_page)
         run_analysis_layout.setContentsMargins(20, 20, 20, 20)
         title = QLabel("Run Analysis")
-        title.setFont(QFont("Montserrat", 18, QFont.Bold))
-        title.setStyleSheet("color: #FFFFFF; margin-bottom: 20px;")
+        title.setFont(_FONT_18_BOLD)
+        title.setObjectName("pageTitle")
         run_analysis_layout.addWidget(title)
 
         content_layout = QHBoxLayout()
@@ -435,70 +726,29 @@ class MainWindow(QMainWindow):
         left_panel.setMaximumWidth(400)
         left_layout = QVBoxLayout(left_panel)
         log_files_label = QLabel("Available Log Files")
-        log_files_label.setFont(QFont("Montserrat", 12, QFont.Bold))
-        log_files_label.setStyleSheet("color: #00C3FF;")
+        log_files_label.setFont(_FONT_12_BOLD)
+        log_files_label.setObjectName("accentTitle")
         left_layout.addWidget(log_files_label)
 
         self.log_files_list = QListWidget()
-        self.log_files_list.setStyleSheet("""
-            QListWidget {
-                background-color: #333333;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                color: #FFFFFF;
-                padding: 10px;
-                border-bottom: 1px solid #444;
-            }
-            QListWidget::item:selected {
-                background-color: #00C3FF;
-                color: #121212;
-            }
-            QListWidget::item:hover:!selected {
-                background-color: #444444;
-            }
-        """)
+        self.log_files_list.setObjectName("logFilesList")
         self.log_files_list.itemClicked.connect(self.log_file_selected)
         left_layout.addWidget(self.log_files_list)
 
         # Add Filter 20km Rides button
         self.filter_button = QPushButton("Filter 20km Rides")
-        self.filter_button.setFont(QFont("Montserrat", 11))
+        self.filter_button.setFont(_FONT_11)
         self.filter_button.setCursor(Qt.PointingHandCursor)
-        self.filter_button.setStyleSheet("""
-            QPushButton {
-                background-color: #00C3FF;
-                color: #121212;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #33D1FF;
-            }
-        """)
+        self.filter_button.setObjectName("primaryButton")
         self.filter_button.clicked.connect(self.filter_log_files)
         left_layout.addWidget(self.filter_button)
 
         # Add Refresh button
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.setFont(QFont("Montserrat", 11))
+        self.refresh_button.setFont(_FONT_11)
         self.refresh_button.setCursor(Qt.PointingHandCursor)
-        self.refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #FFFFFF;
-                border: 1px solid #00C3FF;
-                border-radius: 4px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-            }
-        """)
-        self.refresh_button.clicked.connect(self.populate_log_files)
+        self.refresh_button.setObjectName("secondaryButton")
+        self.refresh_button.clicked.connect(lambda: self.populate_log_files(force=True))
         left_layout.addWidget(self.refresh_button)
 
         right_panel = QWidget()
@@ -508,17 +758,17 @@ class MainWindow(QMainWindow):
         select_file_page = QWidget()
         select_file_layout = QVBoxLayout(select_file_page)
         select_file_label = QLabel("Select a log file to analyze")
-        select_file_label.setFont(QFont("Montserrat", 14))
+        select_file_label.setFont(_FONT_14)
         select_file_label.setAlignment(Qt.AlignCenter)
-        select_file_label.setStyleSheet("color: #FFFFFF;")
+        select_file_label.setObjectName("bodyText")
         select_file_layout.addWidget(select_file_label)
 
         self.analysis_progress_page = QWidget()
         progress_layout = QVBoxLayout(self.analysis_progress_page)
         self.progress_label = QLabel("Analysis in progress...")
-        self.progress_label.setFont(QFont("Montserrat", 14))
+        self.progress_label.setFont(_FONT_14)
         self.progress_label.setAlignment(Qt.AlignCenter)
-        self.progress_label.setStyleSheet("color: #FFFFFF; margin-bottom: 20px;")
+        self.progress_label.setObjectName("progressLabel")
         progress_layout.addWidget(self.progress_label)
 
         self.progress_bar = QProgressBar()
@@ -526,38 +776,25 @@ class MainWindow(QMainWindow):
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(True)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #444;
-                border-radius: 4px;
-                text-align: center;
-                height: 25px;
-                color: #121212;
-                background-color: #333333;
-            }
-            QProgressBar::chunk {
-                background-color: #00C3FF;
-                width: 10px;
-            }
-        """)
+        self.progress_bar.setObjectName("analysisProgress")
         progress_layout.addWidget(self.progress_bar)
 
         self.status_label = QLabel("Initializing...")
-        self.status_label.setFont(QFont("Montserrat", 11))
+        self.status_label.setFont(_FONT_11)
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: #FFFFFF; margin-top: 10px;")
+        self.status_label.setObjectName("statusLabel")
         progress_layout.addWidget(self.status_label)
 
         self.results_page = QScrollArea()
         self.results_page.setWidgetResizable(True)
-        self.results_page.setStyleSheet("background-color: #121212; border: none;")
+        self.results_page.setObjectName("resultsPage")
         results_content = QWidget()
         self.results_layout = QVBoxLayout(results_content)
         self.results_layout.setContentsMargins(10, 10, 10, 10)
         self.results_layout.setSpacing(15)
         self.results_title = QLabel("Analysis Results")
-        self.results_title.setFont(QFont("Montserrat", 16, QFont.Bold))
-        self.results_title.setStyleSheet("color: #00C3FF; margin-bottom: 20px;")
+        self.results_title.setFont(_FONT_16_BOLD)
+        self.results_title.setObjectName("resultsTitle")
         self.results_layout.addWidget(self.results_title)
 
         self.results_widget = QWidget()
@@ -568,37 +805,15 @@ class MainWindow(QMainWindow):
 
         buttons_layout = QHBoxLayout()
         save_report_btn = QPushButton("Save Report")
-        save_report_btn.setFont(QFont("Montserrat", 11))
+        save_report_btn.setFont(_FONT_11)
         save_report_btn.setCursor(Qt.PointingHandCursor)
-        save_report_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00C3FF;
-                color: #121212;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #33D1FF;
-            }
-        """)
+        save_report_btn.setObjectName("primaryButton")
         save_report_btn.clicked.connect(self.save_report)
 
         new_analysis_btn = QPushButton("New Analysis")
-        new_analysis_btn.setFont(QFont("Montserrat", 11))
+        new_analysis_btn.setFont(_FONT_11)
         new_analysis_btn.setCursor(Qt.PointingHandCursor)
-        new_analysis_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #FFFFFF;
-                border: 1px solid #00C3FF;
-                border-radius: 4px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-            }
-        """)
+        new_analysis_btn.setObjectName("secondaryButton")
         new_analysis_btn.clicked.connect(self.reset_analysis)
 
         buttons_layout.addWidget(save_report_btn)
@@ -618,113 +833,139 @@ class MainWindow(QMainWindow):
     def filter_log_files(self):
         """Filter log files based on the 20km rides condition"""
         self.log_files_list.clear()
+        self._shown_log_objects = None
         if not self.bike_imei:
             return
 
+        import numpy as np
         try:
             # Fetch log files from AWS
-            log_files = self.aws_client.get_available_logs(self.bike_imei)
-            filtered_files = []
+            log_objects = self.aws_client.get_available_log_objects(self.bike_imei)
+            log_files = [log_file for log_file, _, _ in log_objects]
+            filtered_files = set()
 
             total_files = len(log_files)
             self.progress_bar.setMaximum(total_files)
             self.progress_bar.setValue(0)
 
-            for i, log_file in enumerate(log_files):
-                self.status_label.setText(f"Processing file {i+1} of {total_files}...")
-                QApplication.processEvents()
-
+            def ride_distance(log_file):
                 log_data = self.aws_client.download_log_file(log_file)
                 if not log_data:
-                    continue
+                    return None
 
-                df = self.aws_client.extract_archive(log_data)
+                df = self.aws_client.extract_archive(log_data, columns=('millis', 'speed'))
                 if df is None or df.empty:
-                    continue
+                    return None
 
                 # Calculate the total distance for the log file
-                distance_arr = (np.array(df['millis'].diff()) * np.array(df['speed']))[1:].sum()
-                if distance_arr > 19:
-                    filtered_files.append(log_file)
-
-                self.progress_bar.setValue(i + 1)
+                return (np.array(df['millis'].diff()) * np.array(df['speed']))[1:].sum()
+
+            # Download and measure several logs at once; the UI only tallies results
+            with ThreadPoolExecutor(max_workers=FILTER_WORKERS) as executor:
+                futures = {executor.submit(ride_distance, log_file): log_file
+                           for log_file in log_files}
+                for done, future in enumerate(as_completed(futures), 1):
+                    self.status_label.setText(f"Processing file {done} of {total_files}...")
+                    try:
+                        distance = future.result()
+                    except Exception as e:
+                        # Skip a log that fails to download or decode
+                        logging.error(f"Error measuring {futures[future]}: {str(e)}")
+                        distance = None
+                    if distance is not None and distance > 19:
+                        filtered_files.add(futures[future])
+                    self.progress_bar.setValue(done)
+                    QApplication.processEvents()
 
             self.status_label.setText("Filtering complete.")
-            self.log_files_list.clear()
-            for log_file in filtered_files:
-                display_name = log_file.split('/')[-1].replace('.parquet.zst', '.parquet')
-                item = QListWidgetItem(display_name)
-                item.setData(Qt.UserRole, log_file)
-                self.log_files_list.addItem(item)
+            self.show_log_files([obj for obj in log_objects if obj[0] in filtered_files])
 
         except Exception as e:
             logging.error(f"Error filtering log files: {str(e)}", exc_info=True)
             self.status_label.setText("Failed to filter log files.")
 
-    def populate_log_files(self):
+    def populate_log_files(self, force=False):
         """Populate the log files list for the current IMEI"""
-        self.log_files_list.clear()
         if not self.bike_imei:
+            self.log_files_list.clear()
+            return
+        if force:
+            self._shown_log_objects = None
+        cached = None if force else load_cached_listing(self.bike_imei)
+        if cached is not None:
+            age, log_objects = cached
+            self.show_log_files(log_objects)
+            if age < LISTING_TTL:
+                return
+        else:
+            self.log_files_list.clear()
+            self._shown_log_objects = None
+        if self.list_logs_thread is not None and self.list_logs_thread.isRunning():
+            return
+        # Fetch log files from AWS in the background
+        self.list_logs_thread = ListLogsThread(self.aws_client, self.bike_imei)
+        self.list_logs_thread.finished.connect(self.show_log_files)
+        self.list_logs_thread.error.connect(self.status_label.setText)
+        self.list_logs_thread.start()
+
+    def show_log_files(self, log_objects):
+        """Fill the log files list, skipping the rebuild if nothing changed"""
+        if log_objects == self._shown_log_objects:
             return
+        self._shown_log_objects = log_objects
+        # Fill with updates and signals off so the list lays out once
+        self.log_files_list.setUpdatesEnabled(False)
+        self.log_files_list.blockSignals(True)
         try:
-            # Fetch log files from AWS
-            log_files = self.aws_client.get_available_logs(self.bike_imei)
-            for log_file in log_files:
+            self.log_files_list.clear()
+            for log_file, last_modified, size in log_objects:
                 # Create display name (last part of path)
-                display_name = log_file.split('/')[-1].replace('.parquet.zst', '.parquet')
+                display_name = log_file.rsplit('/', 1)[-1].replace('.parquet.zst', '.parquet')
                 item = QListWidgetItem(display_name)
                 # Store full path as user data
                 item.setData(Qt.UserRole, log_file)
+                item.setData(LOG_VERSION_ROLE, log_version(last_modified, size))
+                item.setToolTip(f"{size / (1024 * 1024):.1f} MB, modified {last_modified:%Y-%m-%d %H:%M}")
                 self.log_files_list.addItem(item)
-        except Exception as e:
-            logging.error(f"Error fetching log files from AWS: {str(e)}", exc_info=True)
-            self.status_label.setText("Failed to fetch log files from AWS.")
+        finally:
+            self.log_files_list.blockSignals(False)
+            self.log_files_list.setUpdatesEnabled(True)
 
     def log_file_selected(self, item):
         """Enhanced file selection handler with validation"""
-        try:
-            full_key = item.data(Qt.UserRole)
-            print(f"\n[FILE SELECTED] Processing: {full_key}")
-            
-            # Download and extract
-            self.analysis_stack.setCurrentIndex(1)
-            self.status_label.setText("Downloading log file...")
-            log_data = self.aws_client.download_log_file(full_key)
-            
-            if not log_data:
-                raise ValueError("Empty file downloaded from AWS")
-                
-            self.status_label.setText("Extracting and validating data...")
-            df = self.aws_client.extract_archive(log_data)
-            
-            # Normalize and validate
-            df = normalize_column_names(df)
-            print(f"\n[COLUMNS FOUND] {df.columns.tolist()}")
-            
-            # Verify critical columns exist
-            required_cols = {
-                'temp': [f'ts{i}' for i in range(1, 13)] + ['ts0_flt', 'ts13_flt'],
-                'solder': ['dsg_current', 'chg_current'] + [f'cell{i}' for i in range(1, 15)],
-                'weld': ['max_soc']
-            }
-            
-            for analysis_type, cols in required_cols.items():
-                missing = [c for c in cols if c not in df.columns]
-                if missing:
-                    print(f"[WARNING] Missing {analysis_type} columns: {missing}")
-            
-            # Store and analyze
-            self.df = df
-            print("\n[DATA PREVIEW] First 3 rows:")
-            print(df.iloc[:3][[c for c in df.columns if c.startswith(('ts', 'cell'))]])
-            
-            self.start_analysis_thread()
+        # Ignore clicks (e.g. the second half of a double click) while a log is in flight
+        if self._analysis_in_flight:
+            return
+        full_key = item.data(Qt.UserRole)
+        print(f"\n[FILE SELECTED] Processing: {full_key}")
+        self.set_analysis_running(True)
+
+        # Download and decode in the background
+        self.analysis_stack.setCurrentIndex(1)
+        self.update_progress(0, "Downloading log file...")
+        self.load_thread = LoadLogThread(self.aws_client, full_key, item.data(LOG_VERSION_ROLE), self)
+        self.load_thread.progress.connect(self.update_progress)
+        self.load_thread.loaded.connect(self.log_file_loaded)
+        self.load_thread.error.connect(self.show_error)
+        self.load_thread.finished.connect(self.load_thread.deleteLater)
+        self.load_thread.start()
+
+    def log_file_loaded(self, df):
+        """Store a downloaded log and start analysing it"""
+        log_id = (self.load_thread.log_key, self.load_thread.version)
+        self.df = df
+        if log_id != self._plot_cache_log:
+            self.clear_plot_cache()
+            self._plot_cache_log = log_id
+        print("\n[DATA PREVIEW] First 3 rows:")
+        print(df.iloc[:3][[c for c in df.columns if c.startswith(('ts', 'cell'))]])
 
-        except Exception as e:
-            error_msg = f"File Processing Error: {str(e)}"
-            print(f"[FILE ERROR] {error_msg}")
-            self.show_error(error_msg)
-            self.analysis_stack.setCurrentIndex(0)
+        self.start_analysis_thread()
+
+    def set_analysis_running(self, running):
+        """Lock the log list while a log is downloading or being analysed"""
+        self._analysis_in_flight = running
+        self.log_files_list.setEnabled(not running)
 
     def start_analysis_thread(self):
         """Start the analysis thread with the loaded data"""
@@ -741,6 +982,9 @@ class MainWindow(QMainWindow):
 
     def show_error(self, error_msg):
         """Show error message in UI"""
+        self.set_analysis_running(False)
+        # The previous results no longer match the selection
+        self._graph_builders = []
         QMessageBox.critical(self, "Error", error_msg)
         self.status_label.setText("Analysis failed")
         self.progress_bar.setValue(0)
@@ -748,60 +992,69 @@ class MainWindow(QMainWindow):
 
     def show_results(self, solder_results, weld_results, temp_results):
         """Display analysis results with graphs matching reference code"""
-        # Clear previous results
-        for i in reversed(range(self.results_widget_layout.count())):
-            widget = self.results_widget_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        self.set_analysis_running(False)
+        # Clear previous results by swapping in a fresh host widget
+        old_widget = self.results_widget
+        self.results_widget = QWidget()
+        self.results_widget_layout = QVBoxLayout(self.results_widget)
+        self.results_widget_layout.setContentsMargins(0, 0, 0, 0)
+        self.results_widget_layout.setSpacing(15)
+        self.results_layout.replaceWidget(old_widget, self.results_widget)
+        for canvas in list(self._plot_cache.values()) + list(self._idle_canvases.values()):
+            canvas.setParent(None)
+        old_widget.deleteLater()
 
+        # Build the results with updates off so they paint once
+        self.results_widget.setUpdatesEnabled(False)
+        try:
+            self.build_results(solder_results, weld_results, temp_results)
+        finally:
+            self.results_widget.setUpdatesEnabled(True)
+        self.analysis_stack.setCurrentIndex(2)
+
+    def build_results(self, solder_results, weld_results, temp_results):
+        """Create the issue summary and graph widgets for the results page"""
         # Create issues section
         issues_frame = QFrame()
         issues_frame.setFrameShape(QFrame.StyledPanel)
-        issues_frame.setStyleSheet("background-color: #333333; border-radius: 6px; padding: 15px;")
+        issues_frame.setObjectName("resultsFrame")
         issues_layout = QVBoxLayout(issues_frame)
         issues_title = QLabel("Detected Issues")
-        issues_title.setFont(QFont("Montserrat", 14, QFont.Bold))
-        issues_title.setStyleSheet("color: #00C3FF;")
+        issues_title.setFont(_FONT_14_BOLD)
+        issues_title.setObjectName("accentTitle")
         issues_layout.addWidget(issues_title)
 
-        # Solder issues
+        # All three checks share one rich-text label
         solder_text = (
-            "🔥 Solder Issues Detected\n"
-            f"Severity: {solder_results['severity']}\n"
-            f"Locations: {', '.join(solder_results['locations'])}"
+            "🔥 Solder Issues Detected<br>"
+            f"Severity: {escape(str(solder_results['severity']))}<br>"
+            f"Locations: {escape(', '.join(solder_results['locations']))}"
             if solder_results["detected"]
             else "✅ No Solder Issues Detected"
         )
-        solder_label = QLabel(solder_text)
-        solder_label.setFont(QFont("Montserrat", 11))
-        solder_label.setStyleSheet("color: #FFFFFF;")
-        issues_layout.addWidget(solder_label)
-
-        # Weld issues
         weld_text = (
-            "🔥 Weld Issues Detected\n"
-            f"Confidence: {weld_results['confidence']:.0%}\n"
-            f"Cell: {weld_results.get('cell_with_issue', 'N/A')}"
+            "🔥 Weld Issues Detected<br>"
+            f"Confidence: {weld_results['confidence']:.0%}<br>"
+            f"Cell: {escape(str(weld_results.get('cell_with_issue', 'N/A')))}"
             if weld_results["detected"]
             else "✅ No Weld Issues Detected"
         )
-        weld_label = QLabel(weld_text)
-        weld_label.setFont(QFont("Montserrat", 11))
-        weld_label.setStyleSheet("color: #FFFFFF;")
-        issues_layout.addWidget(weld_label)
-
-        # Temperature issues
         temp_text = (
-            "🔥 Temperature Fluctuations Detected\n"
-            f"Max Fluctuation: {temp_results['max_fluctuation']:.4f}\n"
-            f"Sensors: {', '.join(temp_results['critical_points'])}"
+            "🔥 Temperature Fluctuations Detected<br>"
+            f"Max Fluctuation: {temp_results['max_fluctuation']:.4f}<br>"
+            f"Sensors: {escape(', '.join(temp_results['critical_points']))}"
             if temp_results["detected"]
             else "✅ No Temperature Fluctuations Detected"
         )
-        temp_label = QLabel(temp_text)
-        temp_label.setFont(QFont("Montserrat", 11))
-        temp_label.setStyleSheet("color: #FFFFFF;")
-        issues_layout.addWidget(temp_label)
+        issues_label = QLabel()
+        issues_label.setTextFormat(Qt.RichText)
+        issues_label.setText("".join(
+            f"<p style='margin-bottom: 36px'>{text}</p>"
+            for text in (solder_text, weld_text, temp_text)
+        ))
+        issues_label.setFont(_FONT_11)
+        issues_label.setObjectName("bodyText")
+        issues_layout.addWidget(issues_label)
 
         issues_layout.addStretch()
         self.results_widget_layout.addWidget(issues_frame)
@@ -809,106 +1062,216 @@ class MainWindow(QMainWindow):
         # Create plots section
         plots_frame = QFrame()
         plots_frame.setFrameShape(QFrame.StyledPanel)
-        plots_frame.setStyleSheet("background-color: #333333; border-radius: 6px; padding: 15px;")
+        plots_frame.setObjectName("resultsFrame")
         plots_layout = QVBoxLayout(plots_frame)
         plots_title = QLabel("Analysis Graphs")
-        plots_title.setFont(QFont("Montserrat", 14, QFont.Bold))
-        plots_title.setStyleSheet("color: #00C3FF;")
+        plots_title.setFont(_FONT_14_BOLD)
+        plots_title.setObjectName("accentTitle")
         plots_layout.addWidget(plots_title)
 
+        # Graphs are reused while the same log is shown with the same highlights.
+        # For a new log, the canvases of the previous one are redrawn in place;
+        # only graphs with no canvas to reuse are built on a PlotThread.
+        Figure, _, _ = load_matplotlib()
+        from analysis.run_analysis import CELL_COLUMNS
+        df = self.df
+        imei = self.bike_imei
+
+        def graph_axes(fig):
+            if fig is None:
+                fig = Figure(figsize=(8, 4), dpi=100)
+                fig.add_subplot(111)
+            return fig, fig.axes[0]
+
         # Temperature plot
-        fig = Figure(figsize=(8, 4), dpi=100)
-        ax = fig.add_subplot(111)
-        temp_sensors = [col for col in self.df.columns if col.startswith('ts')]
-        for sensor in temp_sensors:
-            highlight = sensor in temp_results['critical_points']
-            ax.plot(
-                self.df.index,
-                self.df[sensor],
-                linewidth=3 if highlight else 1,
-                alpha=1.0 if highlight else 0.3,
-                label=sensor
-            )
-        ax.set_title(f'IMEI {self.bike_imei} - Temperature Fluctuation', fontsize=10)
-        ax.set_xlabel('Data Point Index', fontsize=8)
-        ax.set_ylabel('Temperature (°C)', fontsize=8)
-        ax.legend()
-        ax.grid(True)
-        canvas = FigureCanvas(fig)
-        canvas.mpl_connect('button_press_event', lambda event: self.open_enlarged_graph(event, fig, 'Temperature Fluctuation', 'Data Point Index', 'Temperature (°C)', self.df.index, self.df[temp_sensors]))
-        plots_layout.addWidget(canvas)
+        def build_temp_figure(fig=None):
+            fig, ax = graph_axes(fig)
+            temp_sensors = [col for col in df.columns if col.startswith('ts')]
+            # One contiguous block per graph; the plot and the click handler share it
+            x_arr = df.index.to_numpy(copy=False)
+            y_arr = df[temp_sensors].to_numpy(copy=False)
+            self.plot_channels(ax, x_arr, y_arr, temp_sensors, temp_results['critical_points'])
+            ax.set_title(f'IMEI {imei} - Temperature Fluctuation', fontsize=10)
+            ax.set_xlabel('Data Point Index', fontsize=8)
+            ax.set_ylabel('Temperature (°C)', fontsize=8)
+            ax.grid(True)
+            return fig, ('Temperature Fluctuation', 'Data Point Index', 'Temperature (°C)', x_arr, y_arr)
 
         # Solder plot
-        fig = Figure(figsize=(8, 4), dpi=100)
-        ax = fig.add_subplot(111)
-        cell_cols = [f'cell{i}' for i in range(1, 15)]
-        y_data = {}
-        for cell in cell_cols:
-            highlight = cell in solder_results['locations']
-            ax.plot(
-                self.df.index,
-                self.df[cell],
-                linewidth=3 if highlight else 1,
-                alpha=1.0 if highlight else 0.3,
-                label=cell
-            )
-            y_data[cell] = self.df[cell]
-        ax.set_title(f'IMEI {self.bike_imei} - Solder Issue', fontsize=10)
-        ax.set_xlabel('Data Point Index', fontsize=8)
-        ax.set_ylabel('Voltage (V)', fontsize=8)
-        ax.legend()
-        ax.grid(True)
-        canvas = FigureCanvas(fig)
-        canvas.mpl_connect('button_press_event', lambda event: self.open_enlarged_graph(event, fig, 'Solder Issue', 'Data Point Index', 'Voltage (V)', self.df.index, y_data))
-        plots_layout.addWidget(canvas)
+        def build_solder_figure(fig=None):
+            fig, ax = graph_axes(fig)
+            x_arr = df.index.to_numpy(copy=False)
+            mat = df[CELL_COLUMNS].to_numpy(copy=False)
+            self.plot_channels(ax, x_arr, mat, CELL_COLUMNS, solder_results['locations'])
+            y_data = {cell: mat[:, j] for j, cell in enumerate(CELL_COLUMNS)}
+            ax.set_title(f'IMEI {imei} - Solder Issue', fontsize=10)
+            ax.set_xlabel('Data Point Index', fontsize=8)
+            ax.set_ylabel('Voltage (V)', fontsize=8)
+            ax.grid(True)
+            return fig, ('Solder Issue', 'Data Point Index', 'Voltage (V)', x_arr, y_data)
 
         # Weld plot
-        fig = Figure(figsize=(8, 4), dpi=100)
-        ax = fig.add_subplot(111)
-        cell_cols = [f'cell{i}' for i in range(1, 15)]
-        for cell in cell_cols:
-            highlight = cell == weld_results.get('cell_with_issue')
-            ax.plot(
-                self.df.index,
-                self.df[cell],
-                linewidth=3 if highlight else 1,
-                alpha=1.0 if highlight else 0.3,
-                label=cell
-            )
-        ax.set_title(f'IMEI {self.bike_imei} - Weld Issue', fontsize=10)
-        ax.set_xlabel('Data Point Index', fontsize=8)
-        ax.set_ylabel('Voltage (V)', fontsize=8)
-        ax.legend()
-        ax.grid(True)
-        ax.text(0.02, 0.02, f'SOC: {self.df["max_soc"].iloc[0]}%', transform=ax.transAxes, fontsize=8)
-        canvas = FigureCanvas(fig)
-        canvas.mpl_connect('button_press_event', lambda event: self.open_enlarged_graph(event, fig, 'Weld Issue', 'Data Point Index', 'Voltage (V)', self.df.index, self.df[cell_cols]))
-        plots_layout.addWidget(canvas)
+        def build_weld_figure(fig=None):
+            fig, ax = graph_axes(fig)
+            x_arr = df.index.to_numpy(copy=False)
+            y_arr = df[CELL_COLUMNS].to_numpy(copy=False)
+            self.plot_channels(ax, x_arr, y_arr, CELL_COLUMNS, [weld_results.get('cell_with_issue')])
+            ax.set_title(f'IMEI {imei} - Weld Issue', fontsize=10)
+            ax.set_xlabel('Data Point Index', fontsize=8)
+            ax.set_ylabel('Voltage (V)', fontsize=8)
+            ax.grid(True)
+            soc_text = f'SOC: {df["max_soc"].iloc[0]}%'
+            if ax.texts:
+                ax.texts[0].set_text(soc_text)
+            else:
+                ax.text(0.02, 0.02, soc_text, transform=ax.transAxes, fontsize=8)
+            return fig, ('Weld Issue', 'Data Point Index', 'Voltage (V)', x_arr, y_arr)
+
+        self._graph_placeholders = {}
+        self._graph_builders = [
+            (("temp", tuple(temp_results['critical_points'])), build_temp_figure),
+            (("solder", tuple(solder_results['locations'])), build_solder_figure),
+            (("weld", weld_results.get('cell_with_issue')), build_weld_figure)
+        ]
+        pending = []
+        for key, build in self._graph_builders:
+            canvas = self._plot_cache.get(key)
+            if canvas is None and key[0] in self._idle_canvases:
+                # Update the previous log's lines and labels instead of a new figure
+                canvas = self._plot_cache[key] = self._idle_canvases.pop(key[0])
+                fig, click_args = build(canvas.figure)
+                self.connect_graph_click(canvas, fig, click_args)
+                canvas.draw_idle()
+            if canvas is None:
+                canvas = QLabel("Preparing graph...")
+                canvas.setAlignment(Qt.AlignCenter)
+                canvas.setMinimumHeight(400)
+                canvas.setObjectName("graphPlaceholder")
+                self._graph_placeholders[key] = canvas
+                pending.append((key, build))
+            plots_layout.addWidget(canvas)
 
         self.results_widget_layout.addWidget(plots_frame)
 
-        self.analysis_stack.setCurrentIndex(2)
+        if pending:
+            self.plot_thread = PlotThread(pending, self)
+            self.plot_thread.figure_ready.connect(self.attach_graph)
+            self.plot_thread.error.connect(self.status_label.setText)
+            self.plot_thread.finished.connect(self.plot_thread.deleteLater)
+            self.plot_thread.start()
+        else:
+            self.plot_thread = None
+
+    def attach_graph(self, key, fig, click_args):
+        """Put a figure built by the PlotThread into the results page"""
+        # Figures from a thread started for earlier results are dropped
+        if self.sender() is not self.plot_thread:
+            return
+        placeholder = self._graph_placeholders.pop(key, None)
+        if placeholder is None:
+            return
+        _, FigureCanvas, _ = load_matplotlib()
+        canvas = FigureCanvas(fig)
+        self.connect_graph_click(canvas, fig, click_args)
+        self._plot_cache[key] = canvas
+        placeholder.parentWidget().layout().replaceWidget(placeholder, canvas)
+        placeholder.deleteLater()
+
+    def connect_graph_click(self, canvas, fig, click_args):
+        """Open the enlarged graph for click_args when the canvas is clicked"""
+        if getattr(canvas, 'click_cid', None) is not None:
+            canvas.mpl_disconnect(canvas.click_cid)
+        canvas.click_cid = canvas.mpl_connect('button_press_event', lambda event, fig=fig, args=click_args: self.open_enlarged_graph(event, fig, *args))
+
+    def clear_plot_cache(self):
+        """Drop cached result graphs, keeping one canvas per graph to redraw for the next log"""
+        for (detector, _), canvas in self._plot_cache.items():
+            if detector not in self._idle_canvases:
+                self._idle_canvases[detector] = canvas
+            elif canvas.parent() is None:
+                canvas.deleteLater()
+        self._plot_cache = {}
+        self._graph_builders = []
+
+    def plot_channels(self, ax, x, values, columns, highlighted):
+        """Plot the columns of a channel block and legend the highlighted ones
+
+        Lines already on the axes are updated with set_data when there is one
+        per column; otherwise the axes are cleared and plotted with one
+        ax.plot call.
+        """
+        import numpy as np
+        highlighted = set(highlighted)
+        mask = np.fromiter((c in highlighted for c in columns), dtype=bool, count=len(columns))
+        x, values = thin_channels(x, values)
+        if len(ax.lines) == len(columns):
+            lines = list(ax.lines)
+            for line, column_x, column_values in zip(lines, x.T, values.T):
+                line.set_data(column_x, column_values)
+        else:
+            if ax.lines:
+                ax.cla()
+            lines = ax.plot(x, values, rasterized=True)
+        widths = np.where(mask, 3, 1)
+        alphas = np.where(mask, 1.0, 0.3)
+        for line, column, width, alpha in zip(lines, columns, widths, alphas):
+            line.set(label=column, linewidth=width, alpha=alpha)
+        # Fix the limits from the block's extremes (with the default 5% margin)
+        # so matplotlib does not re-autoscale for every line
+        if len(x) and not np.isnan(values).all():
+            xmin, xmax = x[0, 0], x[-1, 0]
+            ymin, ymax = np.nanmin(values), np.nanmax(values)
+            xpad = (xmax - xmin) * 0.05 or 0.5
+            ypad = (ymax - ymin) * 0.05 or 0.5
+            ax.set_xlim(xmin - xpad, xmax + xpad)
+            ax.set_ylim(ymin - ypad, ymax + ypad)
+            ax.set_autoscale_on(False)
+        highlighted_lines = [line for line, highlight in zip(lines, mask) if highlight]
+        if highlighted_lines:
+            ax.legend(handles=highlighted_lines)
+        elif ax.get_legend() is not None:
+            ax.get_legend().remove()
+        return lines
 
     def open_enlarged_graph(self, event, figure, title, x_label, y_label, x_data, y_data):
         """Open the graph in an enlarged format"""
         if event.button == 1:  # Left mouse button
-            dialog = GraphDialog(title, x_label, y_label, x_data, y_data, self)
+            if self._graph_view is None:
+                self._graph_view = GraphView()
+            dialog = GraphDialog(title, x_label, y_label, x_data, y_data, self, self._graph_view)
             dialog.exec_()
 
     def save_report(self):
         """Save analysis report to file"""
+        if self.report_thread is not None and self.report_thread.isRunning():
+            return
+        if not self._graph_builders:
+            QMessageBox.information(self, "Save Report", "Run an analysis before saving a report.")
+            return
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Report", "", "PDF Files (*.pdf);;All Files (*)"
+            self, "Save Report", "", "PDF Files (*.pdf);;All Files (*)",
+            options=QFileDialog.HideNameFilterDetails
+        )
+        if not file_path:
+            return
+        # The thread builds its own figures from the results page builders, so it
+        # never touches a figure the UI thread may be painting
+        self.report_thread = ReportThread(self._graph_builders, file_path)
+        self.report_thread.finished.connect(self.report_saved)
+        self.report_thread.error.connect(lambda msg: QMessageBox.critical(self, "Error", msg))
+        self.report_thread.start()
+
+    def report_saved(self, file_path):
+        """Tell the user where the report was written"""
+        QMessageBox.information(
+            self,
+            "Report Saved",
+            f"Report has been saved to:\n{file_path}"
         )
-        if file_path:
-            QMessageBox.information(
-                self,
-                "Report Saved",
-                f"Report has been saved to:\n{file_path}"
-            )
 
     def reset_analysis(self):
         """Reset the analysis UI"""
+        self._graph_builders = []
         self.analysis_stack.setCurrentIndex(0)
         self.progress_bar.setValue(0)
         self.status_label.setText("")
@@ -923,7 +1286,6 @@ class MainWindow(QMainWindow):
             QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            from gui.barcode_scan_window import BarcodeScanWindow
             self.barcode_scan_window = BarcodeScanWindow()
             self.barcode_scan_window.show()
             self.close()
@@ -938,7 +1300,6 @@ class MainWindow(QMainWindow):
             QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            from gui.login_window import LoginWindow
             self.login_window = LoginWindow()
             self.login_window.show()
             self.close()
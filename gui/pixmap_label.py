@@ -0,0 +1,44 @@
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtGui import QPixmap, QPainter
+from PyQt5.QtCore import Qt, QRect, QPoint, QTimer
+
+class AspectPixmapLabel(QLabel):
+    """Label that paints its pixmap scaled to fit, keeping the aspect ratio"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = QPixmap()
+        # Fast (unfiltered) painting while a resize is in progress
+        self._resizing = False
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(40)
+        self._settle_timer.timeout.connect(self._end_resize)
+
+    def setSourcePixmap(self, pixmap):
+        """Set the full-size pixmap; scaling happens at paint time"""
+        self._source = pixmap
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # The first layout on show is painted smoothly straight away
+        if event.oldSize().isValid():
+            self._resizing = True
+            self._settle_timer.start()
+
+    def _end_resize(self):
+        """Repaint with smooth filtering once the size stops changing"""
+        self._resizing = False
+        self.update()
+
+    def paintEvent(self, event):
+        if self._source.isNull():
+            super().paintEvent(event)
+            return
+        # Fit and center the image, like setPixmap on a pre-scaled copy did
+        target = QRect(QPoint(0, 0), self._source.size().scaled(self.size(), Qt.KeepAspectRatio))
+        target.moveCenter(self.rect().center())
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, not self._resizing)
+        painter.drawPixmap(target, self._source)
@@ -3,9 +3,11 @@ import ssl
 import certifi
 from pathlib import Path
 import logging
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def configure_ssl():
-    """Configure SSL settings for the entire application"""
+    """Configure SSL settings for the entire application (runs once per process)"""
     try:
         # Get certifi's CA bundle path
         ca_bundle = certifi.where()
@@ -14,9 +16,7 @@ def configure_ssl():
         if not Path(ca_bundle).exists():
             raise FileNotFoundError(f"CA bundle not found at: {ca_bundle}")
         
-        # Debug output
-        print(f"Using CA Bundle: {ca_bundle}")
-        print(f"CA Bundle exists: {Path(ca_bundle).exists()}")
+        logging.debug(f"Using CA Bundle: {ca_bundle}")
         
         # Create a custom SSL context
         ssl_context = ssl.create_default_context(cafile=ca_bundle)
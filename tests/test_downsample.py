@@ -0,0 +1,31 @@
+import numpy as np
+
+from analysis.downsample import minmax_envelope
+
+
+def test_short_series_is_kept_whole():
+    values = np.arange(12.0).reshape(6, 2)
+    keep = minmax_envelope(values, 10)
+    assert keep.shape == (6, 2)
+    assert (keep == np.arange(6)[:, None]).all()
+
+
+def test_every_channel_keeps_its_own_spikes():
+    rng = np.random.default_rng(0)
+    values = rng.normal(3.7, 0.001, size=(50000, 14))
+    values[12345, 4] = 4.2    # spike on one channel
+    values[40000, 9] = 3.1    # dropout on another
+    keep = minmax_envelope(values, 2000)
+    assert keep.shape[0] <= 2000 and keep.shape[1] == 14
+    assert 12345 in keep[:, 4]
+    assert 40000 in keep[:, 9]
+    # Row order is preserved and both ends are kept for every channel
+    assert (np.diff(keep, axis=0) >= 0).all()
+    assert (keep[0] == 0).all() and (keep[-1] == len(values) - 1).all()
+
+
+def test_nan_only_bucket_keeps_the_gap():
+    values = np.ones((10000, 1))
+    values[5000:5100] = np.nan
+    keep = minmax_envelope(values, 2000)[:, 0]
+    assert np.isnan(values[keep, 0]).any()
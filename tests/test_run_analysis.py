@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.run_analysis import (
+    CELL_COLUMNS,
+    DETECTORS,
+    TEMP_COLUMNS,
+    downcast_telemetry,
+    normalize_column_names,
+    run_detectors,
+    solder_issue_detection,
+    weld_issue_detection,
+)
+
+
+def rest_log(cells, soc=15, rows=60):
+    """A log resting (no current) for `rows` samples with constant cell voltages"""
+    df = pd.DataFrame({f'Cell{i}': np.full(rows, volts) for i, volts in enumerate(cells, 1)})
+    df['dsg_current'] = 0.0
+    df['chg_current'] = 0.0
+    df['max_soc'] = soc
+    return df
+
+
+def loaded(df):
+    """The frame as LoadLogThread hands it to the detectors"""
+    return downcast_telemetry(normalize_column_names(df.copy()))
+
+
+def test_detector_inputs_stay_float64():
+    df = loaded(rest_log([3.7] * 14))
+    assert (df[CELL_COLUMNS + ['dsg_current', 'chg_current']].dtypes == np.float64).all()
+
+
+def test_weld_spread_on_threshold():
+    # 3.720 - 3.700 sits exactly on the 0.02 weld threshold
+    cells = [3.72] * 14
+    cells[2] = 3.70
+    result = weld_issue_detection(loaded(rest_log(cells)))
+    assert result['detected']
+    assert result['cell_with_issue'] == 'cell3'
+
+
+@pytest.mark.parametrize("low, high", [(3.695, 3.705), (3.6899, 3.7101)])
+def test_solder_spread_on_threshold(low, high):
+    # First case: the spread sits exactly on the 0.01 run threshold;
+    # second: the outer cells sit just past the 0.01 quartile distance
+    cells = [3.7] * 14
+    cells[4] = low
+    cells[5] = high
+    raw = rest_log(cells)
+    expected = solder_issue_detection(normalize_column_names(raw.copy()))
+    assert solder_issue_detection(loaded(raw)) == expected
+    assert expected['detected'] == (high - low > 0.02)
+
+
+def drive_log(seed, rows=400):
+    """A noisy log with rest and driving stretches, temperatures and a weak cell"""
+    rng = np.random.default_rng(seed)
+    cells = 3.7 + rng.normal(0, 0.004, (rows, 14))
+    cells[:, seed % 14] -= 0.03 * (seed % 3)
+    if seed % 2:
+        cells[:, 5] += 0.02
+        cells[:, 6] -= 0.02
+    df = pd.DataFrame(cells, columns=[f'Cell{i}' for i in range(1, 15)])
+    current = np.where(np.arange(rows) % 100 < 50, 0.0, 40.0)
+    df['dsg_current'] = current + rng.normal(0, 0.1, rows)
+    df['chg_current'] = 0.0
+    df['max_soc'] = 10 + seed
+    temps = 30 + rng.normal(0, seed % 3, (rows, len(TEMP_COLUMNS)))
+    for i, col in enumerate(TEMP_COLUMNS):
+        df[col] = temps[:, i]
+    return loaded(df)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_concurrent_detectors_match_sequential(seed):
+    df = drive_log(seed)
+    expected = {name: func(df) for name, func in DETECTORS.items()}
+    assert run_detectors(df) == expected